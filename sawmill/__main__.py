@@ -1,86 +1,160 @@
 """Entry point for sawmill CLI."""
 
+from __future__ import annotations
+
 import fnmatch
+import functools
 import json
-import textwrap
+import re
+import weakref
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import rich_click as click
-from rich.console import Console
-from rich.table import Table
 
-from sawmill.core.aggregation import Aggregator
-from sawmill.core.filter import FilterEngine
-from sawmill.core.plugin import NoPluginFoundError, PluginConflictError, PluginManager
-from sawmill.core.waiver import WaiverGenerator, WaiverLoader, WaiverMatcher, WaiverValidationError
-from sawmill.models.waiver import Waiver
+# Rich rendering, the core engines and the models are imported where they
+# are used, so that fast paths such as --version do not pay for them.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from sawmill.core.plugin import PluginManager
+    from sawmill.core.waiver import WaiverMatcher
+    from sawmill.models.message import Message
+    from sawmill.models.plugin_api import SeverityLevel
+    from sawmill.models.waiver import Waiver
+    from sawmill.plugin import SawmillPlugin
 
 click.rich_click.TEXT_MARKUP = "rich"
 click.rich_click.SHOW_ARGUMENTS = True
 
+# Number of messages rendered per console.print call in text output
+_TEXT_OUTPUT_BATCH_SIZE = 256
+
+# Number of JSON lines joined into each stdout write in json output
+_JSON_OUTPUT_BATCH_SIZE = 1024
 
+
+@functools.lru_cache(maxsize=1)
 def _get_plugin_manager() -> PluginManager:
     """Create and configure the plugin manager.
 
     Discovers plugins via entry points (including built-in plugins
-    registered in pyproject.toml).
+    registered in pyproject.toml). Entry-point discovery scans installed
+    package metadata, so the manager is created once and shared by every
+    caller in the process.
 
     Returns:
         Configured PluginManager instance.
     """
+    from sawmill.core.plugin import PluginManager
+
     manager = PluginManager()
     manager.discover()
     return manager
 
 
-def _get_implemented_hooks(plugin) -> list[str]:
-    """Get list of hooks implemented by a plugin.
+def _reset_plugin_manager() -> None:
+    """Drop the shared plugin manager so the next call rediscovers plugins.
 
-    Args:
-        plugin: The plugin instance to check.
+    Both the manager and the entry-point lookup behind discover() are
+    cached, so both are cleared; plugins installed or removed since the
+    last call are then picked up.
 
-    Returns:
-        List of hook names that are implemented.
+    Intended for tests that install or register plugins at runtime.
     """
-    hooks = []
+    from sawmill.core.plugin import _plugin_entry_points
 
-    # Check each hook by seeing if the plugin has a non-default implementation
-    # We do this by checking if the method exists and is decorated with hookimpl
-    from sawmill.plugin import hookimpl
+    _get_plugin_manager.cache_clear()
+    _plugin_entry_points.cache_clear()
 
-    for hook_name in ["can_handle", "load_and_parse", "get_filters", "extract_file_reference"]:
-        method = getattr(plugin, hook_name, None)
-        if method is not None:
-            # Check if it's marked as a hookimpl
-            if hasattr(method, "sawmill_impl"):
-                hooks.append(hook_name)
-    return hooks
 
+@dataclass(frozen=True)
+class _SeverityTables:
+    """Severity lookups derived from a plugin's severity levels.
 
-def _get_severity_levels(plugin):
-    """Get severity levels from plugin.
+    Attributes:
+        levels: SeverityLevel objects, in the order the plugin declares them.
+        ranked: The same levels sorted most severe first.
+        level_map: Dictionary mapping lowercase severity ID to level number.
+        style_map: Dictionary mapping lowercase severity ID to Rich style.
+    """
+
+    levels: tuple[SeverityLevel, ...]
+    ranked: tuple[SeverityLevel, ...]
+    level_map: dict[str, int]
+    style_map: dict[str, str]
+
+
+# Severity tables per plugin instance, dropped along with the plugin
+_severity_tables_cache: weakref.WeakKeyDictionary[Any, _SeverityTables] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_severity_tables(plugin) -> _SeverityTables:
+    """Get the severity lookups for a plugin, building them on first use.
+
+    A run consults the severity levels in several places (filtering,
+    styling, fail-on threshold, reports), so the plugin hook is called and
+    its result validated once per plugin instance.
 
     Args:
         plugin: The plugin instance to get levels from.
 
     Returns:
-        List of SeverityLevel objects.
+        The plugin's severity tables.
 
     Raises:
         RuntimeError: If plugin doesn't implement get_severity_levels().
     """
+    try:
+        return _severity_tables_cache[plugin]
+    except (KeyError, TypeError):
+        pass
+
     from sawmill.models.plugin_api import severity_levels_from_dicts
 
     if plugin and hasattr(plugin, "get_severity_levels"):
         severity_dicts = plugin.get_severity_levels()
-        return severity_levels_from_dicts(severity_dicts)
+        levels = tuple(severity_levels_from_dicts(severity_dicts))
     else:
         raise RuntimeError(
             f"Plugin must implement get_severity_levels(). "
             "This hook is required for all plugins."
         )
 
+    tables = _SeverityTables(
+        levels=levels,
+        ranked=tuple(sorted(levels, key=lambda s: -s.level)),
+        level_map={level.id.lower(): level.level for level in levels},
+        style_map={level.id.lower(): level.style or "" for level in levels},
+    )
+    try:
+        _severity_tables_cache[plugin] = tables
+    except TypeError:
+        # Plugins that cannot be weakly referenced are simply not cached
+        pass
+    return tables
+
+
+def _get_severity_levels(plugin):
+    """Get severity levels from plugin.
+
+    Args:
+        plugin: The plugin instance to get levels from.
+
+    Returns:
+        List of SeverityLevel objects.
+
+    Raises:
+        RuntimeError: If plugin doesn't implement get_severity_levels().
+    """
+    return list(_get_severity_tables(plugin).levels)
+
 
 def _get_severity_style_map(plugin) -> dict[str, str]:
     """Build a severity style map from plugin's severity levels.
@@ -91,8 +165,7 @@ def _get_severity_style_map(plugin) -> dict[str, str]:
     Returns:
         Dictionary mapping severity ID to Rich style string.
     """
-    severity_levels = _get_severity_levels(plugin)
-    return {level.id.lower(): level.style or "" for level in severity_levels}
+    return _get_severity_tables(plugin).style_map
 
 
 def _get_severity_style(severity: str | None, style_map: dict[str, str]) -> str:
@@ -119,20 +192,20 @@ def _get_severity_level_map(plugin) -> dict[str, int]:
     Returns:
         Dictionary mapping severity ID to level number.
     """
-    severity_levels = _get_severity_levels(plugin)
-    return {level.id.lower(): level.level for level in severity_levels}
+    return _get_severity_tables(plugin).level_map
 
 
 def _severity_at_or_above(
     message_severity: str | None,
-    min_severity: str,
+    min_level: int,
     level_map: dict[str, int],
 ) -> bool:
     """Check if message severity is at or above the minimum level.
 
     Args:
         message_severity: The message's severity (may be None).
-        min_severity: The minimum severity level to show.
+        min_level: The minimum numeric severity level to show. Resolve it
+            once per run rather than per message.
         level_map: Dictionary mapping severity ID to level number.
 
     Returns:
@@ -141,32 +214,65 @@ def _severity_at_or_above(
     if message_severity is None:
         return False
 
-    msg_level = level_map.get(message_severity.lower(), -1)
-    min_level = level_map.get(min_severity.lower(), 0)
-    return msg_level >= min_level
+    return level_map.get(message_severity.lower(), -1) >= min_level
+
+
+def _severity_ids_at_or_above(level_map: dict[str, int], min_level: int) -> frozenset[str]:
+    """Get the severity IDs whose level is at or above a threshold.
+
+    Comparing each message's level against the threshold can then be
+    replaced by a set lookup on its severity ID.
+
+    Args:
+        level_map: Dictionary mapping severity ID to level number.
+        min_level: The minimum numeric severity level.
+
+    Returns:
+        Frozen set of the matching severity IDs.
+    """
+    return frozenset(level_id for level_id, level in level_map.items() if level >= min_level)
 
 
-def _has_check_failures(messages: list, plugin, min_level: int = 1) -> bool:
+def _has_check_failures(
+    messages: Iterable[Message],
+    plugin,
+    min_level: int = 1,
+    matcher: WaiverMatcher | None = None,
+) -> bool:
     """Check if messages contain severities at or above the threshold.
 
     Used by --check mode to determine exit code.
 
     Args:
-        messages: List of unwaived messages to check.
+        messages: Messages to check. Stops at the first failure.
         plugin: Plugin instance to get severity level map from.
         min_level: Minimum severity level that causes failure.
+        matcher: If given, messages are not yet waived, and a failing
+            message only counts when no waiver matches it. Waivers are only
+            matched against messages that would otherwise fail.
 
     Returns:
-        True if there are messages at or above the threshold.
+        True if there are unwaived messages at or above the threshold.
     """
     level_map = _get_severity_level_map(plugin)
-
-    for msg in messages:
-        if msg.severity:
-            msg_level = level_map.get(msg.severity.lower(), 0)
-            if msg_level >= min_level:
-                return True
-    return False
+    failing_ids = _severity_ids_at_or_above(level_map, min_level)
+
+    # The plugin's own severity IDs are decided by set lookup; anything else
+    # (e.g., different casing) falls back to the level lookup. Messages
+    # without a severity (None or "") never fail, whatever the threshold.
+    failing = (
+        msg
+        for msg in messages
+        if msg.severity in failing_ids
+        or (
+            msg.severity
+            and msg.severity not in level_map
+            and level_map.get(msg.severity.lower(), 0) >= min_level
+        )
+    )
+    if matcher is None:
+        return any(True for _ in failing)
+    return any(matcher.is_waived(msg) is None for msg in failing)
 
 
 def _get_fail_on_level(fail_on: str | None, plugin) -> int:
@@ -187,11 +293,10 @@ def _get_fail_on_level(fail_on: str | None, plugin) -> int:
 
     if fail_on is None:
         # Default: fail on everything above the lowest severity level
-        severity_levels = _get_severity_levels(plugin)
-        sorted_levels = sorted(severity_levels, key=lambda s: s.level)
-        if len(sorted_levels) >= 2:
-            return sorted_levels[1].level
-        return sorted_levels[0].level if sorted_levels else 0
+        ranked = _get_severity_tables(plugin).ranked
+        if len(ranked) >= 2:
+            return ranked[-2].level
+        return ranked[0].level if ranked else 0
 
     fail_on_lower = fail_on.lower()
     if fail_on_lower not in level_map:
@@ -203,6 +308,21 @@ def _get_fail_on_level(fail_on: str | None, plugin) -> int:
     return level_map[fail_on_lower]
 
 
+def _waiver_key(waiver: Waiver) -> tuple:
+    """Get a hashable key under which equal waivers count as one.
+
+    Waivers are compared by value, so exact duplicates in a waiver file are
+    used (and reported) together.
+
+    Args:
+        waiver: The waiver to build a key for.
+
+    Returns:
+        Tuple of the waiver's field values.
+    """
+    return tuple(waiver.model_dump().values())
+
+
 def _apply_waivers(
     messages: list,
     matcher: WaiverMatcher,
@@ -219,14 +339,22 @@ def _apply_waivers(
     unwaived: list = []
     waived: list = []
     used_waivers: list[Waiver] = []
+    seen_ids: set[int] = set()
+    used_keys: set[tuple] = set()
 
     for msg in messages:
         waiver = matcher.is_waived(msg)
         if waiver:
             waived.append((msg, waiver))
-            # Track used waivers (by identity, not by hash)
-            if waiver not in used_waivers:
-                used_waivers.append(waiver)
+            # Track used waivers by value, in first-use order, with set
+            # lookups rather than comparing against every waiver seen so far.
+            # Each waiver object's key is built only the first time it is seen.
+            if id(waiver) not in seen_ids:
+                seen_ids.add(id(waiver))
+                key = _waiver_key(waiver)
+                if key not in used_keys:
+                    used_keys.add(key)
+                    used_waivers.append(waiver)
         else:
             unwaived.append(msg)
 
@@ -265,6 +393,11 @@ def _generate_check_report(
 
     level_map = {level.id: level.level for level in severity_levels}
 
+    # One pass over the unwaived messages counts them by severity, decides
+    # the exit code and builds the issues list (unwaived messages with
+    # CI-relevant severities)
+    exit_code = 0
+    issues = []
     for msg in messages:
         if msg.severity:
             sev = msg.severity.lower()
@@ -272,13 +405,22 @@ def _generate_check_report(
                 counts[sev] += 1
             else:
                 counts["other"] += 1
+            if not exit_code and level_map.get(sev, 0) >= min_level:
+                exit_code = 1
         else:
             counts["other"] += 1
+        issues.append({
+            "message_id": msg.message_id,
+            "severity": msg.severity,
+            "content": msg.content,
+            "line": msg.start_line,
+            "raw_text": msg.raw_text,
+        })
 
-    # Count waived messages by severity
+    # Likewise count waived messages by severity and build the waived list
     waived_counts: dict[str, int] = {level.id: 0 for level in severity_levels}
     waived_counts["other"] = 0
-
+    waived_list = []
     for msg, waiver in waived_messages:
         if msg.severity:
             sev = msg.severity.lower()
@@ -288,30 +430,6 @@ def _generate_check_report(
                 waived_counts["other"] += 1
         else:
             waived_counts["other"] += 1
-
-    # Calculate exit code based on unwaived messages and threshold
-    exit_code = 0
-    for msg in messages:
-        if msg.severity:
-            msg_level = level_map.get(msg.severity.lower(), 0)
-            if msg_level >= min_level:
-                exit_code = 1
-                break
-
-    # Build issues list (unwaived messages with CI-relevant severities)
-    issues = []
-    for msg in messages:
-        issues.append({
-            "message_id": msg.message_id,
-            "severity": msg.severity,
-            "content": msg.content,
-            "line": msg.start_line,
-            "raw_text": msg.raw_text,
-        })
-
-    # Build waived list
-    waived_list = []
-    for msg, waiver in waived_messages:
         waived_list.append({
             "message_id": msg.message_id,
             "severity": msg.severity,
@@ -322,15 +440,17 @@ def _generate_check_report(
             "waiver_reason": waiver.reason,
         })
 
-    # Find unused waivers
-    unused_waivers = []
-    for waiver in all_waivers:
-        if waiver not in used_waivers:
-            unused_waivers.append({
-                "pattern": waiver.pattern,
-                "type": waiver.type,
-                "reason": waiver.reason,
-            })
+    # Find unused waivers (by value, as _apply_waivers tracks them)
+    used_keys = {_waiver_key(waiver) for waiver in used_waivers}
+    unused_waivers = [
+        {
+            "pattern": waiver.pattern,
+            "type": waiver.type,
+            "reason": waiver.reason,
+        }
+        for waiver in all_waivers
+        if _waiver_key(waiver) not in used_keys
+    ]
 
     # Build the report with dynamic severity counts
     summary = {
@@ -357,67 +477,49 @@ def _generate_check_report(
     return report
 
 
-def _match_message_id(message_id: str | None, pattern: str) -> bool:
-    """Check if a message ID matches a pattern (supports wildcards).
+def _compile_id_patterns(patterns: Iterable[str]) -> re.Pattern[str]:
+    """Compile message ID glob patterns into a single regex.
 
-    Uses fnmatch for glob-style pattern matching:
+    Uses fnmatch glob semantics:
     - '*' matches any sequence of characters
     - '?' matches any single character
 
+    Message IDs are tool identifiers rather than file names, so matching is
+    case-sensitive on every platform, as with ``fnmatch.fnmatchcase``.
+    Each glob is translated once and the results are joined into one
+    alternation, so a message ID is tested against all patterns with a
+    single match call.
+
     Args:
-        message_id: The message ID to check (may be None).
-        pattern: The pattern to match against (e.g., "Synth 8-*").
+        patterns: The patterns to match against (e.g., "Synth 8-*").
 
     Returns:
-        True if the message ID matches the pattern.
+        Compiled regex; use ``.match()`` on a message ID.
     """
-    if message_id is None:
-        return False
-
-    return fnmatch.fnmatch(message_id, pattern)
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
 
 
-def _process_log_file(
+def _select_plugin(
     ctx: click.Context,
     console: Console,
-    logfile: str,
+    manager: PluginManager,
+    path: Path,
     plugin_name: str | None,
-    severity: str | None,
-    filter_pattern: str | None,
-    suppress_patterns: tuple[str, ...],
-    suppress_ids: tuple[str, ...],
-    id_patterns: tuple[str, ...],
-    categories: tuple[str, ...],
-    output_format: str,
-    summary: bool = False,
-    group_by: str | None = None,
-    top_n: int = 5,
-) -> tuple[list, dict[str, str]]:
-    """Process a log file with the specified filters.
+) -> SawmillPlugin:
+    """Select the plugin for a log file, exiting with an error if none fits.
 
     Args:
         ctx: Click context.
-        console: Rich console for output.
-        logfile: Path to the log file.
+        console: Rich console for error output.
+        manager: Plugin manager to select the plugin from.
+        path: Path to the log file.
         plugin_name: Specific plugin to use (or None for auto-detect).
-        severity: Minimum severity level to show.
-        filter_pattern: Regex pattern to include.
-        suppress_patterns: Regex patterns to exclude.
-        suppress_ids: Message IDs to exclude.
-        id_patterns: Message ID patterns to include (supports wildcards).
-        categories: Categories to include.
-        output_format: Output format (text, json, count).
-        summary: If True, show summary view instead of messages.
-        group_by: Group output by this field (severity, id, file, category).
-        top_n: Limit messages per group when using group_by.
 
     Returns:
-        Tuple of (filtered messages, severity style map).
+        The selected plugin instance.
     """
-    manager = _get_plugin_manager()
-    path = Path(logfile)
+    from sawmill.core.plugin import NoPluginFoundError, PluginConflictError
 
-    # Select plugin
     if plugin_name:
         plugin = manager.get_plugin(plugin_name)
         if plugin is None:
@@ -447,6 +549,60 @@ def _process_log_file(
         console.print("[red]Error:[/red] Plugin not found.")
         ctx.exit(1)
 
+    return plugin
+
+
+def _process_log_file(
+    ctx: click.Context,
+    console: Console,
+    manager: PluginManager,
+    logfile: str,
+    plugin_name: str | None,
+    severity: str | None,
+    filter_pattern: str | None,
+    suppress_patterns: tuple[str, ...],
+    suppress_ids: tuple[str, ...],
+    id_patterns: tuple[str, ...],
+    categories: tuple[str, ...],
+    output_format: str,
+    summary: bool = False,
+    group_by: str | None = None,
+    top_n: int = 5,
+    keep_messages: bool = True,
+) -> tuple[list, dict[str, str], SawmillPlugin]:
+    """Process a log file with the specified filters.
+
+    Args:
+        ctx: Click context.
+        console: Rich console for output.
+        manager: Plugin manager to select the plugin from.
+        logfile: Path to the log file.
+        plugin_name: Specific plugin to use (or None for auto-detect).
+        severity: Minimum severity level to show.
+        filter_pattern: Regex pattern to include.
+        suppress_patterns: Regex patterns to exclude.
+        suppress_ids: Message IDs to exclude.
+        id_patterns: Message ID patterns to include (supports wildcards).
+        categories: Categories to include.
+        output_format: Output format (text, json, count).
+        summary: If True, show summary view instead of messages.
+        group_by: Group output by this field (severity, id, file, category).
+        top_n: Limit messages per group when using group_by.
+        keep_messages: If False, the caller does not need the filtered
+            messages, so plain output and the summary stream them straight
+            from the filters without building a list.
+
+    Returns:
+        Tuple of (filtered messages, severity style map, plugin used). The
+        message list is empty when keep_messages is False and the output
+        was streamed.
+    """
+    from sawmill.core.filter import FilterEngine
+
+    path = Path(logfile)
+
+    plugin = _select_plugin(ctx, console, manager, path, plugin_name)
+
     # Get severity level and style maps from plugin
     severity_level_map = _get_severity_level_map(plugin)
     severity_style_map = _get_severity_style_map(plugin)
@@ -477,56 +633,99 @@ def _process_log_file(
                 console.print("\nUse --list-severity to see all available levels.")
                 ctx.exit(1)
 
-    # Load and parse the file using the plugin
-    messages = plugin.load_and_parse(path)
+    # Prepare every requested filter once. Each is a predicate that keeps a
+    # message; they are listed cheapest first so that costly regex searches
+    # only run on messages that survive the set lookups.
+    keep: list[Callable[[Message], bool]] = []
+
+    # Apply suppress-id filters
+    if suppress_ids:
+        # Messages without an ID (None) are never in the set, so they pass
+        suppress_id_set = frozenset(suppress_ids)
+        keep.append(lambda msg: msg.message_id not in suppress_id_set)
+
+    # Apply category filters (include only matching)
+    if categories:
+        category_set = frozenset(c.lower() for c in categories)
+        # Logs use few distinct categories, so each is lower-cased and
+        # decided once rather than per message
+        category_kept: dict[str | None, bool] = {}
+
+        def in_categories(msg: Message) -> bool:
+            kept = category_kept.get(msg.category)
+            if kept is None:
+                kept = category_kept[msg.category] = (
+                    msg.category is not None and msg.category.lower() in category_set
+                )
+            return kept
+
+        keep.append(in_categories)
 
     # Apply severity filter
     if severity:
-        messages = [
-            msg for msg in messages
-            if _severity_at_or_above(msg.severity, severity, severity_level_map)
-        ]
+        min_level = severity_level_map[severity.lower()]
+        # Decide the plugin's own severity IDs up front; only IDs it does not
+        # declare (None, other casing) need the full level lookup.
+        passing_ids = _severity_ids_at_or_above(severity_level_map, min_level)
+        keep.append(
+            lambda msg: msg.severity in passing_ids
+            or (
+                msg.severity not in severity_level_map
+                and _severity_at_or_above(msg.severity, min_level, severity_level_map)
+            )
+        )
+
+    # Apply message ID pattern filters (include only matching)
+    if id_patterns:
+        id_match = _compile_id_patterns(id_patterns).match
+        keep.append(
+            lambda msg: msg.message_id is not None
+            and id_match(msg.message_id) is not None
+        )
 
     # Apply regex filter if specified
     if filter_pattern:
-        engine = FilterEngine()
-        messages = engine.apply_filter(filter_pattern, messages)
+        try:
+            filter_search = re.compile(filter_pattern).search
+        except re.error:
+            # An invalid regex matches nothing, as in FilterEngine.apply_filter
+            keep.append(lambda msg: False)
+        else:
+            keep.append(lambda msg: filter_search(msg.raw_text) is not None)
 
     # Apply suppression patterns
     if suppress_patterns:
-        engine = FilterEngine()
-        messages = engine.apply_suppressions(list(suppress_patterns), messages)
-
-    # Apply suppress-id filters
-    if suppress_ids:
-        suppress_id_set = set(suppress_ids)
-        messages = [
-            msg for msg in messages
-            if msg.message_id is None or msg.message_id not in suppress_id_set
-        ]
-
-    # Apply message ID pattern filters (include only matching)
-    if id_patterns:
-        filtered = []
-        for msg in messages:
-            for pattern in id_patterns:
-                if _match_message_id(msg.message_id, pattern):
-                    filtered.append(msg)
-                    break
-        messages = filtered
-
-    # Apply category filters (include only matching)
-    if categories:
-        category_set = {c.lower() for c in categories}
-        messages = [
-            msg for msg in messages
-            if msg.category and msg.category.lower() in category_set
-        ]
+        suppressed = FilterEngine().suppression_matcher(list(suppress_patterns))
+        if suppressed is not None:
+            keep.append(lambda msg: not suppressed(msg.raw_text))
+
+    # Parse the file lazily using the plugin and run all filters in the same
+    # pass, so only the messages that pass them are ever held in memory.
+    # Plugins that do not provide the streaming hook are parsed in one go.
+    iter_messages = getattr(plugin, "iter_messages", None)
+    if iter_messages is not None:
+        messages: Iterable[Message] = iter_messages(path)
+    else:
+        messages = plugin.load_and_parse(path)
+    for predicate in keep:
+        messages = filter(predicate, messages)
 
     # Get severity levels from plugin for aggregation and count format
     severity_levels = _get_severity_levels(plugin)
     severity_ids = [level.id for level in severity_levels]
 
+    # Plain output and the summary consume messages once, so unless the
+    # caller needs them (waivers, reports, checks) they are handled as the
+    # filters yield them
+    if not keep_messages and not group_by:
+        if summary:
+            _print_summary(console, messages, severity_style_map, severity_levels)
+        else:
+            _output_messages(console, messages, output_format, severity_style_map, severity_ids)
+        return [], severity_style_map, plugin
+
+    messages = list(messages)
+
     # Output based on mode
     if summary:
         _print_summary(console, messages, severity_style_map, severity_levels)
@@ -535,12 +734,12 @@ def _process_log_file(
     else:
         _output_messages(console, messages, output_format, severity_style_map, severity_ids)
 
-    return messages, severity_style_map
+    return messages, severity_style_map, plugin
 
 
 def _output_messages(
     console: Console,
-    messages: list,
+    messages: Iterable[Message],
     output_format: str,
     style_map: dict[str, str],
     severity_ids: list[str] | None = None,
@@ -549,13 +748,18 @@ def _output_messages(
 
     Args:
         console: Rich console for output.
-        messages: List of messages to output.
+        messages: Messages to output (any iterable, e.g. a generator).
         output_format: Output format (text, json, count).
         style_map: Dictionary mapping severity ID to Rich style string.
         severity_ids: List of severity IDs from plugin (for count format).
     """
     if output_format.lower() == "json":
-        # JSONL format: one JSON object per line
+        # JSONL format: one JSON object per line. Lines are written to stdout
+        # in batches rather than with one print call per message.
+        import sys
+
+        write = sys.stdout.write
+        json_lines: list[str] = []
         for msg in messages:
             obj = {
                 "start_line": msg.start_line,
@@ -572,7 +776,12 @@ def _output_messages(
                     "path": msg.file_ref.path,
                     "line": msg.file_ref.line,
                 }
-            print(json.dumps(obj))
+            json_lines.append(json.dumps(obj))
+            if len(json_lines) >= _JSON_OUTPUT_BATCH_SIZE:
+                write("\n".join(json_lines) + "\n")
+                json_lines = []
+        if json_lines:
+            write("\n".join(json_lines) + "\n")
 
     elif output_format.lower() == "count":
         # Count format: summary statistics by severity
@@ -583,18 +792,19 @@ def _output_messages(
             counts = {}
         counts["other"] = 0
 
-        for msg in messages:
-            if msg.severity:
-                sev = msg.severity.lower()
-                if sev in counts:
-                    counts[sev] += 1
-                else:
-                    counts["other"] += 1
+        # Tally the raw severity values in C, then fold the few distinct
+        # values into the plugin's IDs. Plugins report their own severity
+        # IDs, so those are tried as is before lower-casing.
+        for sev, n in Counter(msg.severity for msg in messages).items():
+            if sev in counts:
+                counts[sev] += n
+            elif sev and sev.lower() in counts:
+                counts[sev.lower()] += n
             else:
-                counts["other"] += 1
+                counts["other"] += n
 
         # Output the summary with dynamic severity names
-        total = len(messages)
+        total = sum(counts.values())
         parts = [f"total={total}"]
         for sev_id in (severity_ids or []):
             parts.append(f"{sev_id}={counts.get(sev_id, 0)}")
@@ -602,21 +812,56 @@ def _output_messages(
             parts.append(f"other={counts['other']}")
         console.print(" ".join(parts))
 
+    elif not console.is_terminal:
+        # Text format when piped or redirected: colors would be dropped
+        # anyway, and Rich would wrap long lines to the console width, so
+        # the raw log text is written as is
+        write = console.file.write
+        raw_lines: list[str] = []
+        for msg in messages:
+            raw_lines.append(msg.raw_text)
+            if len(raw_lines) >= _TEXT_OUTPUT_BATCH_SIZE:
+                write("\n".join(raw_lines) + "\n")
+                raw_lines = []
+        if raw_lines:
+            write("\n".join(raw_lines) + "\n")
+
     else:
         # Text format (default): human-readable with colors
         # Note: We use markup=False to prevent Rich from interpreting
         # log content like [/path/to/file:line] as markup tags.
+        #
+        # Each message is rendered as console.print would render it (emoji,
+        # severity style underneath), but the lines are printed in batches:
+        # every print call has a fixed cost for render setup, locking and
+        # writing, which dominates for large logs. Rich's repr highlighter is
+        # skipped since log lines are not Python reprs, and running its
+        # regexes over every line costs more than the rest of the rendering.
+        from rich.text import Text
+
+        newline = Text("\n")
+        # Logs use a handful of severity spellings, so each is resolved to a
+        # style once rather than lower-cased and looked up per message
+        styles: dict[str | None, str] = {}
+        rendered: list[Text] = []
         for msg in messages:
-            style = _get_severity_style(msg.severity, style_map)
+            line = console.render_str(msg.raw_text, markup=False, highlight=False)
+            style = styles.get(msg.severity)
+            if style is None:
+                style = styles[msg.severity] = _get_severity_style(msg.severity, style_map)
             if style:
-                console.print(msg.raw_text, style=style, markup=False)
-            else:
-                console.print(msg.raw_text, markup=False)
+                line.stylize_before(style)
+            rendered.append(line)
+            if len(rendered) >= _TEXT_OUTPUT_BATCH_SIZE:
+                console.print(newline.join(rendered))
+                rendered = []
+        if rendered:
+            console.print(newline.join(rendered))
 
 
 def _print_summary(
     console: Console,
-    messages: list,
+    messages: Iterable[Message],
     style_map: dict[str, str],
     severity_levels: list,
 ) -> None:
@@ -626,10 +871,12 @@ def _print_summary(
 
     Args:
         console: Rich console for output.
-        messages: List of messages to summarize.
+        messages: Messages to summarize (any iterable, e.g. a generator).
         style_map: Dictionary mapping severity ID to Rich style string.
         severity_levels: List of SeverityLevel objects from plugin.
     """
+    from sawmill.core.aggregation import Aggregator
+
     aggregator = Aggregator(severity_levels=severity_levels)
     summary = aggregator.get_summary(messages)
 
@@ -662,7 +909,8 @@ def _print_summary(
 
     console.print()
     console.print("=" * 70)
-    console.print(f"Total: {len(messages)} messages")
+    total = sum(stats.total for stats in summary.values())
+    console.print(f"Total: {total} messages")
     console.print("=" * 70)
 
 
@@ -686,6 +934,10 @@ def _print_grouped(
         style_map: Dictionary mapping severity ID to Rich style string.
         severity_levels: List of SeverityLevel objects from plugin.
     """
+    import textwrap
+
+    from sawmill.core.aggregation import Aggregator
+
     aggregator = Aggregator(severity_levels=severity_levels)
     groups = aggregator.group_by(messages, group_by)
 
@@ -701,6 +953,11 @@ def _print_grouped(
     console.print(f"Log Analysis - Grouped by {group_by.title()}")
     console.print("=" * 70)
 
+    # Message content is wrapped with a 2-space indent (aligned with the
+    # severity); one wrapper serves every message
+    indent = "  "
+    wrapper = textwrap.TextWrapper(width=(console.width or 80) - len(indent))
+
     for key, stats in sorted_groups:
         console.print()
         console.print("-" * 70)
@@ -713,11 +970,12 @@ def _print_grouped(
             header = f" {key} [{sev_display}] ({stats.count} messages)"
         elif group_by == "file":
             header = f" {key} ({stats.count} messages)"
-            # Count by severity for file groups
+            # Count by severity for file groups, lower-casing each distinct
+            # severity once rather than once per message
             sev_counts: dict[str, int] = {}
-            for msg in stats.messages:
-                sev = msg.severity.lower() if msg.severity else "other"
-                sev_counts[sev] = sev_counts.get(sev, 0) + 1
+            for sev, n in Counter(msg.severity for msg in stats.messages).items():
+                sev = sev.lower() if sev else "other"
+                sev_counts[sev] = sev_counts.get(sev, 0) + n
             sev_parts = [f"{s.title()}: {c}" for s, c in sorted(sev_counts.items())]
             if sev_parts:
                 console.print(f" File: {key}")
@@ -757,12 +1015,12 @@ def _print_grouped(
             else:
                 console.print(line)
             
-            # Wrap content with 2-space indent (align with severity)
-            indent = "  "
-            width = (console.width or 80) - len(indent)
-            wrapped = textwrap.fill(msg.content, width=width)
-            for wrapped_line in wrapped.split("\n"):
-                console.print(f"{indent}{wrapped_line}", markup=False)
+            # Print all wrapped lines in one call; content that wraps to
+            # nothing still prints one indented line
+            wrapped = wrapper.wrap(msg.content) or [""]
+            console.print(
+                "\n".join(indent + wrapped_line for wrapped_line in wrapped), markup=False
+            )
             console.print()
 
         # Show "and N more" if truncated
@@ -777,6 +1035,7 @@ def _print_grouped(
 def _generate_waivers(
     ctx: click.Context,
     console: Console,
+    manager: PluginManager,
     logfile: str,
     plugin_name: str | None,
     min_waiver_level: int = 1,
@@ -786,6 +1045,7 @@ def _generate_waivers(
     Args:
         ctx: Click context.
         console: Rich console for error output.
+        manager: Plugin manager to select the plugin from.
         logfile: Path to the log file.
         plugin_name: Specific plugin to use (or None for auto-detect).
         min_waiver_level: Minimum severity level to include in waivers.
@@ -794,40 +1054,16 @@ def _generate_waivers(
     """
     import sys
 
+    from rich.console import Console
+
+    from sawmill.core.waiver import WaiverGenerator
+
     # Use stderr console for error messages to keep stdout clean for TOML
     stderr_console = Console(file=sys.stderr)
 
-    manager = _get_plugin_manager()
     path = Path(logfile)
 
-    # Select plugin (same logic as _process_log_file)
-    if plugin_name:
-        plugin = manager.get_plugin(plugin_name)
-        if plugin is None:
-            stderr_console.print(f"[red]Error:[/red] Plugin '{plugin_name}' not found.")
-            stderr_console.print("\nAvailable plugins:")
-            for name in manager.list_plugins():
-                stderr_console.print(f"  - {name}")
-            ctx.exit(1)
-    else:
-        try:
-            detected_name = manager.auto_detect(path)
-            plugin = manager.get_plugin(detected_name)
-        except NoPluginFoundError as e:
-            stderr_console.print(f"[red]Error:[/red] No plugin can handle this file.")
-            stderr_console.print(f"  {e}")
-            stderr_console.print("\nInstalled plugins:")
-            for name in manager.list_plugins():
-                stderr_console.print(f"  - {name}")
-            stderr_console.print("\nUse --plugin to specify a plugin manually.")
-            ctx.exit(1)
-        except PluginConflictError as e:
-            stderr_console.print(f"[red]Error:[/red] {e}")
-            ctx.exit(1)
-
-    if plugin is None:
-        stderr_console.print("[red]Error:[/red] Plugin not found.")
-        ctx.exit(1)
+    plugin = _select_plugin(ctx, stderr_console, manager, path, plugin_name)
 
     # Load and parse the file using the plugin
     messages = plugin.load_and_parse(path)
@@ -848,12 +1084,66 @@ def _generate_waivers(
     print(toml_content)
 
 
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Eager callback for --version: print the version and exit."""
+    if not value or ctx.resilient_parsing:
+        return
+    from sawmill import __version__
+    click.echo(f"sawmill {__version__}")
+    ctx.exit()
+
+
+def _print_plugin_list(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Eager callback for --list-plugins: print the plugin table and exit."""
+    if not value or ctx.resilient_parsing:
+        return
+
+    from rich.console import Console
+
+    console = Console()
+    manager = _get_plugin_manager()
+    plugins = manager.list_plugins()
+
+    if not plugins:
+        console.print("[yellow]No plugins found.[/yellow]")
+        ctx.exit()
+
+    from rich.table import Table
+
+    table = Table(title="Available Plugins")
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Version", style="green")
+    table.add_column("Description")
+
+    for name in sorted(plugins):
+        info = manager.get_plugin_info(name)
+        if info:
+            table.add_row(
+                info["name"],
+                info.get("version", "unknown"),
+                info.get("description", ""),
+            )
+
+    console.print(table)
+    ctx.exit()
+
+
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.argument("logfile", required=False, type=click.Path(exists=True))
-@click.option("--version", is_flag=True, help="Show version and exit.")
+@click.option(
+    "--version",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_print_version,
+    help="Show version and exit.",
+)
 @click.option(
     "--list-plugins",
     is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_print_plugin_list,
     help="List all available plugins and exit."
 )
 @click.option(
@@ -993,8 +1283,6 @@ def _generate_waivers(
 def cli(
     ctx: click.Context,
     logfile: str | None,
-    version: bool,
-    list_plugins: bool,
     plugin: str | None,
     show_info: bool,
     list_groupings: bool,
@@ -1023,37 +1311,9 @@ def cli(
 
     Analyze and filter log files from EDA tools like Vivado.
     """
-    console = Console()
-
-    if version:
-        from sawmill import __version__
-        click.echo(f"sawmill {__version__}")
-        return
-
-    if list_plugins:
-        manager = _get_plugin_manager()
-        plugins = manager.list_plugins()
-
-        if not plugins:
-            console.print("[yellow]No plugins found.[/yellow]")
-            return
+    from rich.console import Console
 
-        table = Table(title="Available Plugins")
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Version", style="green")
-        table.add_column("Description")
-
-        for name in sorted(plugins):
-            info = manager.get_plugin_info(name)
-            if info:
-                table.add_row(
-                    info["name"],
-                    info.get("version", "unknown"),
-                    info.get("description", ""),
-                )
-
-        console.print(table)
-        return
+    console = Console()
 
     if show_info:
         if not plugin:
@@ -1076,7 +1336,7 @@ def cli(
         # Get plugin information
         info = manager.get_plugin_info(plugin)
         filters = plugin_instance.get_filters()
-        hooks = _get_implemented_hooks(plugin_instance)
+        hooks = manager.get_implemented_hooks(plugin)
 
         # Display plugin info
         console.print(f"\n[bold cyan]Plugin: {info['name']}[/bold cyan]")
@@ -1092,6 +1352,8 @@ def cli(
 
         console.print(f"\n[bold]Filters Provided:[/bold] {len(filters)}")
         if filters:
+            from rich.table import Table
+
             filter_table = Table(show_header=True, header_style="bold")
             filter_table.add_column("ID", style="cyan")
             filter_table.add_column("Name")
@@ -1143,6 +1405,8 @@ def cli(
             grouping_fields = DEFAULT_GROUPING_FIELDS
 
         # Display the grouping fields
+        from rich.table import Table
+
         table = Table(title="Available Grouping Fields")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Name", style="green")
@@ -1174,12 +1438,10 @@ def cli(
         else:
             plugin_instance = None
 
-        # Get severity levels from plugin or use defaults
+        # Get severity levels from plugin (most severe first) or use defaults
         if plugin_instance and hasattr(plugin_instance, "get_severity_levels"):
             try:
-                severity_dicts = plugin_instance.get_severity_levels()
-                from sawmill.models.plugin_api import severity_levels_from_dicts
-                severity_levels = severity_levels_from_dicts(severity_dicts)
+                severity_levels = _get_severity_tables(plugin_instance).ranked
             except Exception:
                 severity_levels = None
         else:
@@ -1193,14 +1455,16 @@ def cli(
             )
             return
 
-        # Display the severity levels (sorted by level descending - most severe first)
+        # Display the severity levels (already sorted most severe first)
+        from rich.table import Table
+
         table = Table(title="Available Severity Levels")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Name", style="green")
         table.add_column("Level", justify="right")
         table.add_column("Style")
 
-        for level in sorted(severity_levels, key=lambda x: -x.level):
+        for level in severity_levels:
             table.add_row(
                 level.id,
                 level.name,
@@ -1218,23 +1482,25 @@ def cli(
 
     # Determine if batch mode is needed.
     # Explicit --batch flag, or any output/filter/check flag implies batch.
-    is_batch = batch or any([
-        severity is not None,
-        filter_pattern is not None,
-        suppress_patterns,
-        suppress_ids,
-        id_patterns,
-        categories,
-        generate_waivers,
-        check,
-        fail_on is not None,
-        waivers is not None,
-        show_waived,
-        report_unused,
-        report_file is not None,
-        summary,
-        group_by is not None,
-    ])
+    # The checks stop at the first flag found.
+    is_batch = bool(
+        batch
+        or severity is not None
+        or filter_pattern is not None
+        or suppress_patterns
+        or suppress_ids
+        or id_patterns
+        or categories
+        or generate_waivers
+        or check
+        or fail_on is not None
+        or waivers is not None
+        or show_waived
+        or report_unused
+        or report_file is not None
+        or summary
+        or group_by is not None
+    )
 
     # --format explicitly provided also implies batch
     if not is_batch:
@@ -1249,6 +1515,7 @@ def cli(
 
     if not is_batch:
         # Launch TUI mode
+        from sawmill.core.plugin import NoPluginFoundError, PluginConflictError
         from sawmill.tui import run_tui
 
         log_path = Path(logfile)
@@ -1274,32 +1541,37 @@ def cli(
         )
         return
 
+    # One manager serves plugin selection, waiver generation and reporting
+    manager = _get_plugin_manager()
+
     # Handle waiver generation mode
     if generate_waivers:
-        _generate_waivers(ctx, console, logfile, plugin, waiver_level)
+        _generate_waivers(ctx, console, manager, logfile, plugin, waiver_level)
         return
 
     # Load waivers if specified
     waiver_matcher: WaiverMatcher | None = None
     all_waivers: list[Waiver] = []
     if waivers:
-        waiver_path = Path(waivers)
-        if not waiver_path.exists():
-            console.print(f"[red]Error:[/red] Waiver file not found: {waivers}")
-            ctx.exit(1)
+        from sawmill.core.waiver import WaiverLoader, WaiverMatcher, WaiverValidationError
+
         try:
             loader = WaiverLoader()
-            waiver_file = loader.load(waiver_path)
+            waiver_file = loader.load(Path(waivers))
             all_waivers = waiver_file.waivers
             waiver_matcher = WaiverMatcher(all_waivers)
+        except FileNotFoundError:
+            console.print(f"[red]Error:[/red] Waiver file not found: {waivers}")
+            ctx.exit(1)
         except WaiverValidationError as e:
             console.print(f"[red]Error:[/red] Invalid waiver file: {e}")
             ctx.exit(1)
 
     # Process the log file
-    messages, severity_style_map = _process_log_file(
+    messages, severity_style_map, used_plugin = _process_log_file(
         ctx,
         console,
+        manager,
         logfile,
         plugin,
         severity,
@@ -1312,13 +1584,19 @@ def cli(
         summary,
         group_by,
         top_n,
+        keep_messages=bool(waiver_matcher or report_file or check),
     )
 
-    # Apply waivers if loaded
+    # Apply waivers if loaded. A plain --check only needs to know whether
+    # some failing message is unwaived, so it matches waivers itself.
     waived_messages: list = []
     used_waivers: list[Waiver] = []
+    check_matcher: WaiverMatcher | None = None
     if waiver_matcher:
-        messages, waived_messages, used_waivers = _apply_waivers(messages, waiver_matcher)
+        if show_waived or report_unused or report_file:
+            messages, waived_messages, used_waivers = _apply_waivers(messages, waiver_matcher)
+        else:
+            check_matcher = waiver_matcher
 
     # Show waived messages if requested
     if show_waived and waived_messages:
@@ -1335,63 +1613,45 @@ def cli(
 
     # Report unused waivers if requested
     if report_unused and all_waivers:
-        unused_waivers = [w for w in all_waivers if w not in used_waivers]
+        used_keys = {_waiver_key(w) for w in used_waivers}
+        unused_waivers = [w for w in all_waivers if _waiver_key(w) not in used_keys]
         if unused_waivers:
             console.print("\n[bold yellow]Unused Waivers:[/bold yellow]")
             for waiver in unused_waivers:
                 console.print(f"  - {waiver.pattern} ({waiver.type}): {waiver.reason}")
 
-    # Get plugin for report and check mode
-    report_plugin = None
-    used_plugin_name = plugin if plugin else "unknown"
-    if report_file or check:
-        manager = _get_plugin_manager()
-        if plugin:
-            report_plugin = manager.get_plugin(plugin)
-            used_plugin_name = plugin
-        else:
-            try:
-                detected_name = manager.auto_detect(Path(logfile))
-                report_plugin = manager.get_plugin(detected_name)
-                used_plugin_name = detected_name
-            except (NoPluginFoundError, PluginConflictError):
-                pass
+    # Report and check mode use the plugin that processed the log, rather
+    # than detecting it again
+    if not (report_file or check):
+        return
 
     # Get fail-on level (default: second-lowest severity from plugin)
-    min_level = 1
-    if report_plugin:
-        min_level = _get_fail_on_level(fail_on, report_plugin)
+    min_level = _get_fail_on_level(fail_on, used_plugin)
 
     # Generate check report if requested
     if report_file:
-        if report_plugin:
-            report = _generate_check_report(
-                messages=messages,
-                waived_messages=waived_messages,
-                used_waivers=used_waivers,
-                all_waivers=all_waivers,
-                plugin=report_plugin,
-                min_level=min_level,
-                log_file=logfile,
-                plugin_name=used_plugin_name,
-            )
+        report = _generate_check_report(
+            messages=messages,
+            waived_messages=waived_messages,
+            used_waivers=used_waivers,
+            all_waivers=all_waivers,
+            plugin=used_plugin,
+            min_level=min_level,
+            log_file=logfile,
+            plugin_name=used_plugin.name,
+        )
 
-            # Write the report to file
-            report_path = Path(report_file)
-            # Create parent directories if they don't exist
+        # Write the report to file
+        report_path = Path(report_file)
+        # Create parent directories if they don't exist (a bare file
+        # name has parent ".", which has no parts and always exists)
+        if report_path.parent.parts:
             report_path.parent.mkdir(parents=True, exist_ok=True)
-            report_path.write_text(json.dumps(report, indent=2))
-        else:
-            console.print("[yellow]Warning:[/yellow] Cannot generate report without a valid plugin.")
+        report_path.write_text(json.dumps(report, indent=2))
 
     # Check exit codes (only on unwaived messages)
-    if check:
-        if report_plugin:
-            if _has_check_failures(messages, report_plugin, min_level):
-                ctx.exit(1)
-        else:
-            console.print("[yellow]Warning:[/yellow] Cannot check failures without a valid plugin.")
-            ctx.exit(1)
+    if check and _has_check_failures(messages, used_plugin, min_level, check_matcher):
+        ctx.exit(1)
 
 
 if __name__ == "__main__":
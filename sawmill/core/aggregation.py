@@ -9,6 +9,7 @@ and grouping fields for tool-specific customization.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -46,7 +47,7 @@ def make_severity_sort_key(
     return sort_key
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageStats:
     """Statistics for messages grouped by a key.
 
@@ -76,7 +77,7 @@ class MessageStats:
             self.files_affected.add(message.file_ref.path)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeverityStats:
     """Statistics for a severity level with breakdown by message ID.
 
@@ -177,11 +178,11 @@ class Aggregator:
                     return s.name
         return severity.title().replace("_", " ")
 
-    def get_summary(self, messages: list[Message]) -> dict[str, SeverityStats]:
+    def get_summary(self, messages: Iterable[Message]) -> dict[str, SeverityStats]:
         """Get summary statistics grouped by severity with ID breakdown.
 
         Args:
-            messages: List of messages to summarize.
+            messages: Messages to summarize (any iterable, e.g. a generator).
 
         Returns:
             Dictionary mapping severity to SeverityStats.
@@ -7,14 +7,53 @@ The FilterEngine applies filters, suppressions, and provides statistics.
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Literal
 
 from sawmill.models.filter_def import FilterDefinition
 from sawmill.models.message import Message
 
+# Constructs whose meaning changes when a pattern is embedded in a larger
+# alternation: numbered/named backreferences, conditional groups that refer
+# to a group by number or name, and global inline flags.
+_UNSAFE_TO_COMBINE = re.compile(
+    r"\\[1-9]|\(\?P=|\(\?\(\d|\(\?\(\w|\(\?[aiLmsux]+\)"
+)
 
-@dataclass
+
+def combine_patterns(patterns: list[str], flags: int = 0) -> re.Pattern[str] | None:
+    """Combine regex patterns into a single alternation.
+
+    Searching one ``(?:p1)|(?:p2)|...`` pattern scans each message once
+    instead of once per pattern, and matches exactly when any of the
+    original patterns would.
+
+    Args:
+        patterns: Valid regex patterns to combine.
+        flags: Regex flags applied to the combined pattern.
+
+    Returns:
+        The compiled alternation, or None if the patterns cannot be combined
+        without changing their meaning (backreferences, global inline flags,
+        duplicate group names). Callers should then match patterns one by one.
+    """
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        try:
+            return re.compile(patterns[0], flags)
+        except re.error:
+            return None
+    if any(_UNSAFE_TO_COMBINE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+    except re.error:
+        return None
+
+
+@dataclass(slots=True)
 class FilterStats:
     """Statistics about filter matches.
 
@@ -41,32 +80,36 @@ class FilterEngine:
 
     def apply_filter(
         self,
-        pattern: str,
-        messages: list[Message],
+        pattern: str | re.Pattern[str],
+        messages: Iterable[Message],
         case_sensitive: bool = True,
     ) -> list[Message]:
         """Apply a single regex filter to messages.
 
         Args:
-            pattern: Regular expression pattern to match against message raw_text.
-            messages: List of messages to filter.
+            pattern: Regular expression to match against message raw_text,
+                either as a string or already compiled. A compiled pattern
+                is used as is, with its own flags.
+            messages: Messages to filter (any iterable, e.g. a generator).
             case_sensitive: Whether to perform case-sensitive matching.
+                Ignored when pattern is already compiled.
 
         Returns:
             List of messages that match the pattern.
             Returns empty list if pattern is invalid regex.
         """
-        try:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            compiled = re.compile(pattern, flags)
-        except re.error:
-            # Invalid regex returns empty results
-            return []
+        if isinstance(pattern, re.Pattern):
+            compiled = pattern
+        else:
+            try:
+                flags = 0 if case_sensitive else re.IGNORECASE
+                compiled = re.compile(pattern, flags)
+            except re.error:
+                # Invalid regex returns empty results
+                return []
 
-        return [
-            msg for msg in messages
-            if compiled.search(msg.raw_text)
-        ]
+        search = compiled.search
+        return [msg for msg in messages if search(msg.raw_text)]
 
     def apply_filters(
         self,
@@ -97,7 +140,7 @@ class FilterEngine:
         compiled_filters: list[re.Pattern[str]] = []
         for filt in enabled_filters:
             try:
-                compiled_filters.append(re.compile(filt.pattern))
+                compiled_filters.append(filt.compiled)
             except re.error:
                 # Skip invalid patterns
                 continue
@@ -106,6 +149,12 @@ class FilterEngine:
         if not compiled_filters:
             return []
 
+        if mode == "OR":
+            # Any-match is a single scan over the combined alternation
+            combined = combine_patterns([cf.pattern for cf in compiled_filters])
+            if combined is not None:
+                return [msg for msg in messages if combined.search(msg.raw_text)]
+
         result: list[Message] = []
         for msg in messages:
             if mode == "AND":
@@ -122,7 +171,7 @@ class FilterEngine:
     def apply_suppressions(
         self,
         patterns: list[str],
-        messages: list[Message],
+        messages: Iterable[Message],
     ) -> list[Message]:
         """Apply suppression patterns to remove matching messages.
 
@@ -131,14 +180,32 @@ class FilterEngine:
 
         Args:
             patterns: List of regex patterns for messages to suppress.
-            messages: List of messages to filter.
+            messages: Messages to filter (any iterable, e.g. a generator).
 
         Returns:
             List of messages that do NOT match any suppression pattern.
         """
-        if not patterns:
+        matches = self.suppression_matcher(patterns)
+
+        # If no valid patterns, return all messages
+        if matches is None:
             return list(messages)
 
+        return [msg for msg in messages if not matches(msg.raw_text)]
+
+    def suppression_matcher(self, patterns: list[str]) -> Callable[[str], bool] | None:
+        """Build a function that tests text against all suppression patterns.
+
+        Invalid patterns are skipped. Valid ones are combined into a single
+        alternation where possible, so each text is scanned once.
+
+        Args:
+            patterns: List of regex patterns for messages to suppress.
+
+        Returns:
+            A function returning True if text matches any suppression
+            pattern, or None if there are no valid patterns.
+        """
         # Compile all suppression patterns
         compiled_patterns: list[re.Pattern[str]] = []
         for pattern in patterns:
@@ -148,14 +215,16 @@ class FilterEngine:
                 # Skip invalid patterns
                 continue
 
-        # If no valid patterns, return all messages
         if not compiled_patterns:
-            return list(messages)
+            return None
+
+        # Test every suppression with one scan over the combined alternation
+        combined = combine_patterns([cp.pattern for cp in compiled_patterns])
+        if combined is not None:
+            search = combined.search
+            return lambda text: search(text) is not None
 
-        return [
-            msg for msg in messages
-            if not any(cp.search(msg.raw_text) for cp in compiled_patterns)
-        ]
+        return lambda text: any(cp.search(text) for cp in compiled_patterns)
 
     def get_stats(
         self,
@@ -180,7 +249,7 @@ class FilterEngine:
 
         for filt in enabled_filters:
             try:
-                compiled = re.compile(filt.pattern)
+                compiled = filt.compiled
                 count = sum(1 for msg in messages if compiled.search(msg.raw_text))
                 per_filter[filt.id] = count
             except re.error:
@@ -6,6 +6,7 @@ via Python entry points and registration with pluggy.
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -20,6 +21,30 @@ if TYPE_CHECKING:
 # Entry point group name for sawmill plugins
 ENTRY_POINT_GROUP = "sawmill.plugins"
 
+# Hooks reported as implemented by --show-info, in display order
+HOOK_NAMES = ("can_handle", "load_and_parse", "get_filters", "extract_file_reference")
+
+
+@functools.lru_cache(maxsize=1)
+def _plugin_entry_points() -> tuple:
+    """Look up the entry points registered in the sawmill plugin group.
+
+    Scanning installed package metadata is slow and its result does not
+    change while the process runs, so the lookup is done once and shared by
+    every PluginManager.
+
+    Returns:
+        Tuple of entry points in the plugin group.
+    """
+    if sys.version_info >= (3, 10):
+        from importlib.metadata import entry_points
+
+        return tuple(entry_points(group=ENTRY_POINT_GROUP))
+
+    from importlib.metadata import entry_points
+
+    return tuple(entry_points().get(ENTRY_POINT_GROUP, []))
+
 
 class PluginError(Exception):
     """Base exception for plugin-related errors."""
@@ -60,6 +85,7 @@ class PluginManager:
         self.pm = pluggy.PluginManager("sawmill")
         self.pm.add_hookspecs(SawmillHookSpec)
         self._plugins: dict[str, SawmillPlugin] = {}
+        self._implemented_hooks: dict[str, tuple[str, ...]] = {}
 
     def register(self, plugin: SawmillPlugin) -> None:
         """Register a plugin instance.
@@ -70,6 +96,12 @@ class PluginManager:
         name = plugin.name
         self._plugins[name] = plugin
         self.pm.register(plugin, name=name)
+        # A plugin's hookimpl markers never change, so scan them once here
+        self._implemented_hooks[name] = tuple(
+            hook_name
+            for hook_name in HOOK_NAMES
+            if hasattr(getattr(plugin, hook_name, None), "sawmill_impl")
+        )
 
     def unregister(self, name: str) -> None:
         """Unregister a plugin by name.
@@ -79,6 +111,7 @@ class PluginManager:
         """
         if name in self._plugins:
             plugin = self._plugins.pop(name)
+            self._implemented_hooks.pop(name, None)
             self.pm.unregister(plugin)
 
     def discover(self) -> list[str]:
@@ -92,17 +125,7 @@ class PluginManager:
         """
         discovered = []
 
-        if sys.version_info >= (3, 10):
-            from importlib.metadata import entry_points
-
-            eps = entry_points(group=ENTRY_POINT_GROUP)
-        else:
-            from importlib.metadata import entry_points
-
-            all_eps = entry_points()
-            eps = all_eps.get(ENTRY_POINT_GROUP, [])
-
-        for ep in eps:
+        for ep in _plugin_entry_points():
             try:
                 plugin_class = ep.load()
                 plugin_instance = plugin_class()
@@ -133,6 +156,18 @@ class PluginManager:
         """
         return self._plugins.get(name)
 
+    def get_implemented_hooks(self, name: str) -> list[str]:
+        """Get the hooks a registered plugin implements.
+
+        Args:
+            name: The plugin name.
+
+        Returns:
+            Names of the implemented hooks from HOOK_NAMES, in that order.
+            Empty if no plugin with that name is registered.
+        """
+        return list(self._implemented_hooks.get(name, ()))
+
     def get_plugin_info(self, name: str) -> dict[str, str] | None:
         """Get information about a plugin.
 
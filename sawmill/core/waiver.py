@@ -99,11 +99,12 @@ class WaiverLoader:
                 waiver entries with missing/invalid fields
             FileNotFoundError: If the file doesn't exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Waiver file not found: {path}")
-
         try:
             content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Waiver file not found: {path}") from None
+
+        try:
             data = tomli.loads(content)
         except tomli.TOMLDecodeError as e:
             line = self._extract_line_number(str(e))
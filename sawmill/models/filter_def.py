@@ -24,6 +24,7 @@ class FilterDefinition(BaseModel):
         enabled: Whether the filter is currently active.
         source: Origin of the filter (e.g., "plugin:vivado", "config", "user").
         description: Optional description of what this filter matches.
+        compiled: The compiled pattern (cached, not a model field).
     """
 
     model_config = ConfigDict(frozen=False)
@@ -44,3 +45,20 @@ class FilterDefinition(BaseModel):
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}") from e
         return v
+
+    @property
+    def compiled(self) -> re.Pattern[str]:
+        """The compiled pattern, built on first use and reused afterwards.
+
+        The cached regex is checked against the current pattern on each
+        access, so it stays correct after assignment, model_copy(update=...)
+        and copy.copy/deepcopy, none of which can be relied on to clear it.
+        """
+        # Kept in the instance dict rather than in a PrivateAttr. Since 2.6,
+        # pydantic equality looks only at the declared fields in the instance
+        # dict but compares private attributes in full, so this way equal
+        # filters stay equal once one of them has been compiled.
+        compiled: re.Pattern[str] | None = self.__dict__.get("_compiled")
+        if compiled is None or compiled.pattern != self.pattern:
+            compiled = self.__dict__["_compiled"] = re.compile(self.pattern)
+        return compiled
@@ -9,7 +9,7 @@ from __future__ import annotations
 import re
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FileRef(BaseModel):
@@ -32,7 +32,8 @@ class Message(BaseModel):
         end_line: Last line number in the source log file (1-indexed).
         raw_text: Complete original text including all lines.
         content: Extracted/cleaned message content.
-        severity: Severity level (e.g., "error", "warning", "info", "critical_warning").
+        severity: Severity level ID, as declared by the plugin's
+            get_severity_levels() (e.g., "error", "warning", "critical_warning").
         message_id: Tool-specific message ID (e.g., "Vivado 12-3523").
         category: Optional category for grouping (e.g., "timing", "drc").
         file_ref: Optional reference to source file mentioned in message.
@@ -51,7 +52,9 @@ class Message(BaseModel):
     message_id: Optional[str] = None
     category: Optional[str] = None
     file_ref: Optional[FileRef] = None
-    metadata: dict[str, str] = {}
+    # default_factory avoids pydantic deep-copying a shared {} default for
+    # every message constructed.
+    metadata: dict[str, str] = Field(default_factory=dict)
 
     def matches_filter(self, pattern: str, case_sensitive: bool = True) -> bool:
         """Check if this message matches the given regex pattern.
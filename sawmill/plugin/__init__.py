@@ -21,6 +21,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -55,6 +56,7 @@ class SawmillPlugin:
     Optional hooks (have defaults):
         can_handle(): Detection (default: 0.0)
         load_and_parse(): Parsing (default: empty list)
+        iter_messages(): Streaming parsing (default: iterates load_and_parse())
         get_filters(): Pre-defined filters (default: empty list)
         get_grouping_fields(): Grouping options (default: standard fields)
         extract_file_reference(): File ref extraction (default: None)
@@ -117,6 +119,21 @@ class SawmillPlugin:
         """
         return []
 
+    @hookimpl
+    def iter_messages(self, path: Path) -> Iterator["Message"]:
+        """Default implementation: iterates over load_and_parse().
+
+        Subclasses that can parse incrementally should override this to
+        yield messages as they are parsed.
+
+        Args:
+            path: Path to the log file to parse.
+
+        Returns:
+            Iterator over the messages from load_and_parse().
+        """
+        return iter(self.load_and_parse(path))
+
     @hookimpl
     def get_filters(self) -> list["FilterDefinition"]:
         """Default implementation: returns empty list.
@@ -6,6 +6,7 @@ Plugins use the @hookimpl decorator to register their implementations.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -55,6 +56,12 @@ class SawmillHookSpec:
         3. Group multi-line messages into single Message objects
         4. Extract severity, message IDs, and other metadata
 
+        Set each message's severity to the exact ``id`` of one of the levels
+        from get_severity_levels() (e.g. "critical_warning", not "CRITICAL
+        WARNING"). The base app matches severities against those IDs
+        directly and only falls back to case-insensitive lookups for other
+        values, which is much slower on large logs.
+
         Args:
             path: Path to the log file to parse.
 
@@ -64,6 +71,26 @@ class SawmillHookSpec:
             and end_line set correctly for multi-line messages.
         """
 
+    @hookspec
+    def iter_messages(self, path: Path) -> Iterator["Message"]:
+        """Parse the log file into messages lazily.
+
+        Streaming variant of load_and_parse for callers that consume each
+        message once, such as CLI filtering and output. Yielding messages as
+        they are parsed means only the messages a caller keeps stay in
+        memory, instead of every message in the log.
+
+        Plugins that can parse incrementally should implement this hook.
+        The result must contain the same messages, in the same order, as
+        load_and_parse.
+
+        Args:
+            path: Path to the log file to parse.
+
+        Returns:
+            Iterator over Message objects.
+        """
+
     @hookspec
     def get_filters(self) -> list["FilterDefinition"]:
         """Get filter definitions provided by this plugin.
@@ -7,6 +7,9 @@ including severity, message IDs, and file references.
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -16,24 +19,63 @@ from sawmill.plugin import SawmillPlugin, hookimpl
 
 # Regex patterns for Vivado log parsing
 # Standard message format: TYPE: [Category ID-Number] message [file:line]
-_SEVERITY_PATTERNS = {
-    "critical_warning": re.compile(r"^CRITICAL WARNING:\s*"),
-    "error": re.compile(r"^ERROR:\s*"),
-    "warning": re.compile(r"^WARNING:\s*"),
-    "info": re.compile(r"^INFO:\s*"),
+
+# Message start: severity keyword plus the message ID that usually follows it.
+# Matching both in one pass avoids separate severity and ID scans per line.
+_MESSAGE_PATTERN = re.compile(
+    r"^(CRITICAL WARNING|ERROR|WARNING|INFO):\s*(?:\[([A-Za-z_]+ \d+-\d+)\])?"
+)
+
+# First characters of the severity keywords. Most log lines are not messages,
+# and this check rejects them without entering the regex engine.
+_MESSAGE_START_CHARS = frozenset("CEIW")
+
+# Severity keyword (as written in the log) to severity ID. The IDs are
+# interned so every message shares the same string objects.
+_SEVERITY_BY_KEYWORD = {
+    "CRITICAL WARNING": sys.intern("critical_warning"),
+    "ERROR": sys.intern("error"),
+    "WARNING": sys.intern("warning"),
+    "INFO": sys.intern("info"),
 }
 
+# Severity level definitions returned by get_severity_levels()
+_SEVERITY_LEVELS = (
+    {"id": "error", "name": "Error", "level": 3, "style": "red bold"},
+    {"id": "critical_warning", "name": "Critical Warning", "level": 2, "style": "red"},
+    {"id": "warning", "name": "Warning", "level": 1, "style": "yellow"},
+    {"id": "info", "name": "Info", "level": 0, "style": "cyan"},
+)
+
 # Message ID pattern: [Category Number-ID]
 _MESSAGE_ID_PATTERN = re.compile(r"\[([A-Za-z_]+ \d+-\d+)\]")
 
 # File reference pattern: [/path/to/file.ext:line] or [file.ext:line]
 _FILE_REF_PATTERN = re.compile(r"\[([^\]]+):(\d+)\]\s*$")
 
+# The ":line]" tail that a bracketed file reference must end with
+_FILE_REF_TAIL_PATTERN = re.compile(r":\d+\]\s*$")
+
 # Alternative file reference: /path/to/file.v:53 (without brackets, at end)
 _FILE_REF_INLINE_PATTERN = re.compile(r"(/[^\s\[\]]+\.\w+):(\d+)")
 
-# Vivado header detection (MULTILINE for searching in joined content)
-_VIVADO_HEADER_PATTERN = re.compile(r"^#.*Vivado v\d+\.\d+", re.MULTILINE)
+# A run of path characters starting at its first slash
+_PATH_RUN_PATTERN = re.compile(r"/[^\s\[\]]+")
+
+# Auto-detection signals, scanned in one pass over the head of the file:
+# the Vivado header, a message ID, or a line starting with a severity keyword
+_DETECTION_PATTERN = re.compile(
+    r"(?P<header>^#.*Vivado v\d+\.\d+)"
+    r"|\[(?P<category>[A-Za-z_]+) \d+-\d+\]"
+    r"|(?P<severity>^(?:CRITICAL WARNING|ERROR|WARNING|INFO):)",
+    re.MULTILINE,
+)
+
+# Message ID categories that identify a Vivado log during auto-detection
+_VIVADO_CATEGORIES = frozenset({
+    "Synth", "Vivado", "IP_Flow", "Common", "DRC", "Timing", "Route", "Opt",
+    "Physopt", "Power", "Device", "Project", "Constraints",
+})
 
 # Phase separator pattern
 _PHASE_SEPARATOR_PATTERN = re.compile(r"^-{10,}$")
@@ -47,6 +89,49 @@ _CONTINUATION_PATTERNS = [
 ]
 
 
+def _search_file_ref(text: str) -> Optional[re.Match[str]]:
+    """Find a bracketed file reference at the end of text.
+
+    Equivalent to ``_FILE_REF_PATTERN.search(text)``, but runs in linear
+    time. A plain search retries the pattern from every ``[`` and scans to
+    the end of the line each time, which is quadratic on long lines that
+    contain many brackets and no reference.
+
+    Args:
+        text: The text to search.
+
+    Returns:
+        The match, or None if text does not end with a file reference.
+    """
+    tail = _FILE_REF_TAIL_PATTERN.search(text)
+    if tail is None:
+        return None
+    # The reference cannot contain "]", so it starts after the last one
+    # before the ":line]" tail.
+    return _FILE_REF_PATTERN.search(text, text.rfind("]", 0, tail.start()) + 1)
+
+
+def _search_inline_file_ref(text: str) -> Optional[re.Match[str]]:
+    """Find the first unbracketed /path/file.ext:line reference in text.
+
+    Equivalent to ``_FILE_REF_INLINE_PATTERN.search(text)``, but runs in
+    linear time. A reference lies within a single run of path characters,
+    and if none starts at the run's first slash then none starts at a
+    later one, so each run is tried once instead of once per slash.
+
+    Args:
+        text: The text to search.
+
+    Returns:
+        The match, or None if text has no inline file reference.
+    """
+    for run in _PATH_RUN_PATTERN.finditer(text):
+        match = _FILE_REF_INLINE_PATTERN.match(text, run.start(), run.end())
+        if match:
+            return match
+    return None
+
+
 class VivadoPlugin(SawmillPlugin):
     """Parser for Xilinx Vivado log files.
 
@@ -75,43 +160,31 @@ class VivadoPlugin(SawmillPlugin):
         Returns:
             Confidence score (0.0 to 1.0).
         """
-        if not path.exists():
-            return 0.0
-
+        # A missing or unreadable file fails the open below, which is cheaper
+        # than a separate existence check on every detection
         try:
             # Read first 50 lines to check for Vivado signature
             with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = []
-                for i, line in enumerate(f):
-                    if i >= 50:
-                        break
-                    lines.append(line)
-
-            content = "".join(lines)
+                content = "".join(islice(f, 50))
 
-            # High confidence: Vivado header found
-            if _VIVADO_HEADER_PATTERN.search(content):
-                return 0.95
+            vivado_matches = 0
+            severity_count = 0
+            for match in _DETECTION_PATTERN.finditer(content):
+                kind = match.lastgroup
+                if kind == "header":
+                    # High confidence: Vivado header found
+                    return 0.95
+                if kind == "category":
+                    if match.group("category") in _VIVADO_CATEGORIES:
+                        vivado_matches += 1
+                else:
+                    severity_count += 1
 
             # Medium-high confidence: Multiple Vivado-style message IDs
-            message_ids = _MESSAGE_ID_PATTERN.findall(content)
-            vivado_categories = {"Synth", "Vivado", "IP_Flow", "Common", "DRC", "Timing",
-                                "Route", "Opt", "Physopt", "Power", "Device", "Project",
-                                "Constraints"}
-            vivado_matches = sum(1 for mid in message_ids
-                                if mid.split()[0] in vivado_categories)
-
             if vivado_matches >= 3:
                 return 0.85
 
             # Medium confidence: Has severity patterns typical of Vivado
-            severity_count = 0
-            for line in lines:
-                for pattern in _SEVERITY_PATTERNS.values():
-                    if pattern.match(line):
-                        severity_count += 1
-                        break
-
             if severity_count >= 5:
                 return 0.6
 
@@ -137,61 +210,31 @@ class VivadoPlugin(SawmillPlugin):
         Returns:
             List of Message objects.
         """
-        if not path.exists():
-            return []
-
-        messages: list[Message] = []
-
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-        except Exception:
-            return []
-
-        if not lines:
+                return list(self._iter_messages(f))
+        except OSError:
             return []
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            severity = self._detect_severity(line)
-
-            if severity:
-                # Found a message start
-                start_line = i + 1  # 1-indexed
-                raw_lines = [line]
-
-                # Look for continuation lines
-                j = i + 1
-                while j < len(lines) and self._is_continuation(lines[j]):
-                    raw_lines.append(lines[j])
-                    j += 1
+    @hookimpl
+    def iter_messages(self, path: Path) -> Iterator[Message]:
+        """Parse a Vivado log file lazily, one message at a time.
 
-                end_line = j  # 1-indexed (exclusive becomes inclusive)
-                raw_text = "".join(raw_lines).rstrip("\n")
+        Yields the same messages as load_and_parse without holding them all
+        in memory. A file that cannot be opened yields nothing; a read error
+        part-way through ends the iteration.
 
-                # Extract message components
-                message_id = self._extract_message_id(line)
-                content = self._extract_content(line, severity)
-                file_ref = self.extract_file_reference(raw_text)
-                category = self._extract_category(message_id)
-
-                messages.append(Message(
-                    start_line=start_line,
-                    end_line=end_line,
-                    raw_text=raw_text,
-                    content=content,
-                    severity=severity,
-                    message_id=message_id,
-                    category=category,
-                    file_ref=file_ref,
-                ))
-
-                i = j
-            else:
-                i += 1
+        Args:
+            path: Path to the Vivado log file.
 
-        return messages
+        Yields:
+            Message objects in file order.
+        """
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                yield from self._iter_messages(f)
+        except OSError:
+            return
 
     @hookimpl
     def get_severity_levels(self) -> list[dict]:
@@ -202,32 +245,7 @@ class VivadoPlugin(SawmillPlugin):
         Returns:
             List of severity level definitions.
         """
-        return [
-            {
-                "id": "error",
-                "name": "Error",
-                "level": 3,
-                "style": "red bold",
-            },
-            {
-                "id": "critical_warning",
-                "name": "Critical Warning",
-                "level": 2,
-                "style": "red",
-            },
-            {
-                "id": "warning",
-                "name": "Warning",
-                "level": 1,
-                "style": "yellow",
-            },
-            {
-                "id": "info",
-                "name": "Info",
-                "level": 0,
-                "style": "cyan",
-            },
-        ]
+        return [dict(level) for level in _SEVERITY_LEVELS]
 
     @hookimpl
     def get_grouping_fields(self) -> list[dict]:
@@ -369,35 +387,92 @@ class VivadoPlugin(SawmillPlugin):
         Returns:
             FileRef if found, None otherwise.
         """
+        # Paths are interned: the same source files are referenced by many
+        # messages, so they share one string object each.
+
         # Try bracketed format first: [/path/file.v:53]
-        match = _FILE_REF_PATTERN.search(content)
+        match = _search_file_ref(content)
         if match:
-            path_str = match.group(1)
+            path_str = sys.intern(match.group(1))
             line_num = int(match.group(2))
             return FileRef(path=path_str, line=line_num)
 
         # Try inline format: /path/file.v:53
-        match = _FILE_REF_INLINE_PATTERN.search(content)
+        match = _search_inline_file_ref(content)
         if match:
-            path_str = match.group(1)
+            path_str = sys.intern(match.group(1))
             line_num = int(match.group(2))
             return FileRef(path=path_str, line=line_num)
 
         return None
 
-    def _detect_severity(self, line: str) -> Optional[str]:
-        """Detect the severity level of a log line.
+    def _iter_messages(self, lines: Iterable[str]) -> Iterator[Message]:
+        """Parse messages from an iterable of log lines.
+
+        Lines are consumed one at a time with a single line of lookahead
+        (to find the end of multi-line messages), so the file never has to
+        be held in memory as a whole.
 
         Args:
-            line: The log line to check.
+            lines: Log lines, including line terminators (e.g., an open file).
 
-        Returns:
-            Severity string or None if not a severity line.
+        Yields:
+            Message objects in file order.
         """
-        for severity, pattern in _SEVERITY_PATTERNS.items():
-            if pattern.match(line):
-                return severity
-        return None
+        # Bind hot lookups to locals for the per-line loop
+        line_iter = iter(lines)
+        match_start = _MESSAGE_PATTERN.match
+        start_chars = _MESSAGE_START_CHARS
+        is_continuation = self._is_continuation
+
+        line_num = 0
+        line = next(line_iter, None)
+
+        while line is not None:
+            line_num += 1
+            match = match_start(line) if line[:1] in start_chars else None
+
+            if not match:
+                line = next(line_iter, None)
+                continue
+
+            # Found a message start
+            start_line = line_num  # 1-indexed
+            first_line = line
+
+            # Look for continuation lines. Most messages are a single line,
+            # so the list for joining is only built when one is found.
+            line = next(line_iter, None)
+            if line is not None and is_continuation(line):
+                raw_lines = [first_line]
+                while line is not None and is_continuation(line):
+                    raw_lines.append(line)
+                    line_num += 1
+                    line = next(line_iter, None)
+                raw_text = "".join(raw_lines).rstrip("\n")
+            else:
+                raw_text = first_line.rstrip("\n")
+
+            # Extract message components
+            severity = _SEVERITY_BY_KEYWORD[match.group(1)]
+            message_id = match.group(2) or self._extract_message_id(first_line)
+            if message_id is not None:
+                # IDs repeat across many messages; share one string per ID
+                message_id = sys.intern(message_id)
+            content = self._extract_content(first_line[match.end():])
+            file_ref = self.extract_file_reference(raw_text)
+            category = self._extract_category(message_id)
+
+            yield Message(
+                start_line=start_line,
+                end_line=line_num,
+                raw_text=raw_text,
+                content=content,
+                severity=severity,
+                message_id=message_id,
+                category=category,
+                file_ref=file_ref,
+            )
 
     def _is_continuation(self, line: str) -> bool:
         """Check if a line is a continuation of a previous message.
@@ -418,9 +493,8 @@ class VivadoPlugin(SawmillPlugin):
             return False
 
         # New messages start with severity keywords
-        for pattern in _SEVERITY_PATTERNS.values():
-            if pattern.match(line):
-                return False
+        if line[0] in _MESSAGE_START_CHARS and _MESSAGE_PATTERN.match(line):
+            return False
 
         # Check continuation patterns
         for pattern in _CONTINUATION_PATTERNS:
@@ -443,26 +517,23 @@ class VivadoPlugin(SawmillPlugin):
             return match.group(1)
         return None
 
-    def _extract_content(self, line: str, severity: str) -> str:
-        """Extract the message content without severity prefix.
+    def _extract_content(self, line: str) -> str:
+        """Extract the message content from the text after the message start.
 
         Args:
-            line: The log line.
-            severity: The detected severity level.
+            line: The log line with the severity prefix (and leading message
+                ID, if any) already removed.
 
         Returns:
             The message content.
         """
-        # Remove severity prefix
-        pattern = _SEVERITY_PATTERNS.get(severity)
-        if pattern:
-            line = pattern.sub("", line)
-
-        # Remove message ID
+        # Remove any remaining message IDs
         line = _MESSAGE_ID_PATTERN.sub("", line)
 
         # Remove file reference at end
-        line = _FILE_REF_PATTERN.sub("", line)
+        match = _search_file_ref(line)
+        if match:
+            line = line[:match.start()]
 
         return line.strip()
 
@@ -480,6 +551,6 @@ class VivadoPlugin(SawmillPlugin):
 
         parts = message_id.split()
         if parts:
-            return parts[0].lower()
+            return sys.intern(parts[0].lower())
 
         return None
@@ -4,9 +4,11 @@ Tests cover single filter matching, AND/OR modes, suppressions,
 and edge cases like invalid regex and disabled filters.
 """
 
+import re
+
 import pytest
 
-from sawmill.core.filter import FilterEngine
+from sawmill.core.filter import FilterEngine, combine_patterns
 from sawmill.models.filter_def import FilterDefinition
 from sawmill.models.message import Message
 
@@ -93,6 +95,17 @@ class TestApplyFilter:
 
         assert len(results) == 1
 
+    def test_filter_accepts_compiled_pattern(self):
+        """A precompiled pattern should be used as is, with its own flags."""
+        messages = [
+            Message(start_line=1, end_line=1, raw_text="ERROR: test", content="test"),
+            Message(start_line=2, end_line=2, raw_text="Info: ok", content="ok"),
+        ]
+        engine = FilterEngine()
+        results = engine.apply_filter(re.compile(r"error:", re.IGNORECASE), messages)
+
+        assert [m.raw_text for m in results] == ["ERROR: test"]
+
 
 class TestApplyFiltersAndMode:
     """Tests for multi-filter AND mode."""
@@ -232,6 +245,62 @@ class TestApplyFiltersOrMode:
         assert len(results) == 0
 
 
+class TestCombinePatterns:
+    """Tests for combining patterns into a single alternation."""
+
+    def test_combined_matches_any_pattern(self):
+        """Combined pattern should match wherever any input pattern matches."""
+        combined = combine_patterns([r"^ERROR:", r"timing", r"\[DRC \d+-\d+\]"])
+
+        assert combined is not None
+        assert combined.search("ERROR: failed")
+        assert combined.search("INFO: timing met")
+        assert combined.search("WARNING: [DRC 23-20] rule")
+        assert not combined.search("INFO: all good")
+
+    def test_anchors_stay_scoped_to_each_pattern(self):
+        """An anchor in one pattern should not leak into the others."""
+        combined = combine_patterns([r"^ERROR:", r"slack$"])
+
+        assert combined.search("WNS slack")
+        assert not combined.search("INFO: ERROR: nested")
+
+    def test_empty_patterns_returns_none(self):
+        """No patterns should produce no combined pattern."""
+        assert combine_patterns([]) is None
+
+    def test_backreference_not_combined(self):
+        """Backreferences would renumber inside an alternation."""
+        assert combine_patterns([r"(a)", r"(b)\1"]) is None
+
+    def test_conditional_group_not_combined(self):
+        """Conditional groups would refer to other groups once combined."""
+        patterns = [r"(a)?b", r"(x)?(?(1)y|z)"]
+        assert re.search(patterns[1], "xy")
+
+        assert combine_patterns(patterns) is None
+        assert combine_patterns([r"(a)?b", r"(?P<n>x)?(?(n)y|z)"]) is None
+
+    def test_or_mode_with_conditional_group(self):
+        """OR mode should still match what each conditional pattern matches."""
+        engine = FilterEngine()
+        filters = [
+            FilterDefinition(id="a", name="A", pattern=r"(a)?b", enabled=True),
+            FilterDefinition(id="c", name="C", pattern=r"(x)?(?(1)y|z)", enabled=True),
+        ]
+        msg = Message(start_line=1, end_line=1, raw_text="xy", content="xy")
+
+        assert engine.apply_filters(filters, [msg], mode="OR") == [msg]
+
+    def test_global_inline_flag_not_combined(self):
+        """Global inline flags would apply to every alternative."""
+        assert combine_patterns([r"(?i)error", r"WARNING"]) is None
+
+    def test_duplicate_group_names_not_combined(self):
+        """Duplicate named groups cannot share one pattern."""
+        assert combine_patterns([r"(?P<x>a)", r"(?P<x>b)"]) is None
+
+
 class TestApplySuppressions:
     """Tests for suppression patterns."""
 
@@ -302,6 +371,23 @@ class TestApplySuppressions:
         assert len(results) == 1
         assert "DRC" in results[0].raw_text
 
+    def test_suppression_matcher_tests_any_pattern(self):
+        """The matcher should report text matching any valid pattern."""
+        engine = FilterEngine()
+        matches = engine.suppression_matcher([r"Common 17-\d+", r"[invalid(", r"noise$"])
+
+        assert matches is not None
+        assert matches("INFO: [Common 17-55] startup")
+        assert matches("WARNING: more noise")
+        assert not matches("ERROR: [DRC 1-1] real error")
+
+    def test_suppression_matcher_none_without_valid_patterns(self):
+        """No valid patterns should yield no matcher."""
+        engine = FilterEngine()
+
+        assert engine.suppression_matcher([]) is None
+        assert engine.suppression_matcher([r"[invalid("]) is None
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
@@ -152,6 +152,22 @@ def test_get_plugin_info_not_found():
     assert info is None
 
 
+def test_get_implemented_hooks():
+    """Implemented hooks are recorded at registration and dropped on unregister."""
+    manager = PluginManager()
+    manager.register(MockPlugin())
+
+    assert manager.get_implemented_hooks("mock") == [
+        "can_handle",
+        "load_and_parse",
+        "get_filters",
+        "extract_file_reference",
+    ]
+
+    manager.unregister("mock")
+    assert manager.get_implemented_hooks("mock") == []
+
+
 def test_discover_returns_empty_when_no_plugins():
     """discover() should return empty list when no entry points exist."""
     manager = PluginManager()
@@ -161,6 +177,16 @@ def test_discover_returns_empty_when_no_plugins():
     assert isinstance(discovered, list)
 
 
+def test_discover_registers_fresh_instances_per_manager():
+    """Managers share the entry point scan but not plugin instances."""
+    first = PluginManager()
+    second = PluginManager()
+
+    assert first.discover() == second.discover()
+    for name in first.list_plugins():
+        assert first.get_plugin(name) is not second.get_plugin(name)
+
+
 def test_plugin_error_hierarchy():
     """PluginConflictError and NoPluginFoundError should inherit from PluginError."""
     assert issubclass(PluginConflictError, PluginError)
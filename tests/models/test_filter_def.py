@@ -74,6 +74,40 @@ def test_filter_inequality():
     assert f1 != f2
 
 
+def test_filter_compiled_is_cached():
+    """The compiled pattern should be built once and not affect equality."""
+    f = FilterDefinition(id="t", name="T", pattern="Err.r")
+    assert f.compiled is f.compiled
+    assert f.compiled.search("Error: x")
+    assert f == FilterDefinition(id="t", name="T", pattern="Err.r")
+    assert "compiled" not in f.model_dump()
+
+
+def test_filter_compiled_follows_pattern_changes():
+    """Reassigning the pattern should rebuild the compiled regex."""
+    f = FilterDefinition(id="t", name="T", pattern="first")
+    assert f.compiled.pattern == "first"
+    f.pattern = "second"
+    assert f.compiled.pattern == "second"
+
+
+def test_filter_compiled_follows_model_copy():
+    """A copy with a new pattern should not reuse the original's regex."""
+    import copy
+
+    f = FilterDefinition(id="t", name="T", pattern="first")
+    assert f.compiled.pattern == "first"
+
+    g = f.model_copy(update={"pattern": "second"})
+    assert g.compiled.pattern == "second"
+    assert f.compiled.pattern == "first"
+
+    h = copy.deepcopy(f)
+    h.pattern = "third"
+    assert h.compiled.pattern == "third"
+    assert f.compiled.pattern == "first"
+
+
 def test_complex_regex_accepted():
     """Complex but valid regex patterns should be accepted."""
     f = FilterDefinition(
@@ -48,6 +48,22 @@ def test_base_plugin_extract_file_reference_default():
     assert plugin.extract_file_reference("some content [file.v:123]") is None
 
 
+def test_base_plugin_iter_messages_follows_load_and_parse():
+    """SawmillPlugin.iter_messages should iterate over load_and_parse() by default."""
+    from sawmill.models.message import Message
+
+    message = Message(start_line=1, end_line=1, raw_text="m", content="m")
+
+    class TestPlugin(SawmillPlugin):
+        name = "test"
+
+        @hookimpl
+        def load_and_parse(self, path):
+            return [message]
+
+    assert list(TestPlugin().iter_messages(Path("test.log"))) == [message]
+
+
 def test_hookimpl_decorator_available():
     """hookimpl decorator should be importable and usable."""
     # This test verifies that hookimpl can be used as a decorator
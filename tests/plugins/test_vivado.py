@@ -41,6 +41,15 @@ class TestVivadoCanHandle:
         confidence = plugin.can_handle(log_file)
         assert confidence >= 0.8
 
+    def test_vivado_detects_by_severity_lines(self, tmp_path: Path) -> None:
+        """Plugin should give medium confidence to lines starting with severities."""
+        plugin = VivadoPlugin()
+        log_file = tmp_path / "build.log"
+        log_file.write_text("INFO: started\n" * 3 + "WARNING: odd\n" + "ERROR: failed\n")
+
+        confidence = plugin.can_handle(log_file)
+        assert confidence == 0.6
+
     def test_vivado_handles_nonexistent_file(self, tmp_path: Path) -> None:
         """Plugin should return 0.0 for nonexistent files."""
         plugin = VivadoPlugin()
@@ -151,6 +160,25 @@ class TestVivadoLoadAndParse:
         messages = plugin.load_and_parse(log_file)
         assert messages == []
 
+    def test_vivado_iter_messages_matches_load_and_parse(self, vivado_log: Path) -> None:
+        """iter_messages should yield the same messages as load_and_parse."""
+        plugin = VivadoPlugin()
+
+        assert list(plugin.iter_messages(vivado_log)) == plugin.load_and_parse(vivado_log)
+
+    def test_vivado_iter_messages_nonexistent_file(self, tmp_path: Path) -> None:
+        """iter_messages should yield nothing for a file that cannot be opened."""
+        plugin = VivadoPlugin()
+
+        assert list(plugin.iter_messages(tmp_path / "nonexistent.log")) == []
+
+    def test_vivado_handles_directory(self, tmp_path: Path) -> None:
+        """A path that cannot be opened as a file is not handled or parsed."""
+        plugin = VivadoPlugin()
+
+        assert plugin.can_handle(tmp_path) == 0.0
+        assert plugin.load_and_parse(tmp_path) == []
+
     def test_vivado_extracts_content(self, tmp_path: Path) -> None:
         """Plugin should extract message content without prefix."""
         plugin = VivadoPlugin()
@@ -183,6 +211,21 @@ class TestVivadoLoadAndParse:
         assert messages[0].severity == "info"
         assert messages[1].severity == "warning"
 
+    def test_vivado_shares_repeated_strings(self, tmp_path: Path) -> None:
+        """Repeated IDs, categories and paths should share one string object."""
+        plugin = VivadoPlugin()
+        log_file = tmp_path / "vivado.log"
+        log_file.write_text(
+            "INFO: [Synth 8-6157] synthesizing module 'a' [/src/top.v:10]\n"
+            "INFO: [Synth 8-6157] synthesizing module 'b' [/src/top.v:20]\n"
+        )
+
+        first, second = plugin.load_and_parse(log_file)
+
+        assert first.message_id is second.message_id
+        assert first.category is second.category
+        assert first.file_ref.path is second.file_ref.path
+
 
 class TestVivadoExtractFileReference:
     """Tests for VivadoPlugin.extract_file_reference()."""
@@ -228,6 +271,76 @@ class TestVivadoExtractFileReference:
         assert ref.path == "/path/to/my file.v"
         assert ref.line == 42
 
+    def test_vivado_file_reference_after_other_brackets(self) -> None:
+        """Only the trailing bracketed group should be taken as the reference."""
+        plugin = VivadoPlugin()
+
+        ref = plugin.extract_file_reference("net [data[3]] driven [/src/top.v:7]")
+
+        assert ref is not None
+        assert ref.path == "/src/top.v"
+        assert ref.line == 7
+
+    @pytest.mark.parametrize("unit", ["[", "[a:1", "/a", "/a.b:x", "[/a.b:1 "])
+    @pytest.mark.parametrize(
+        ("prefix", "suffix"),
+        [
+            ("", ""),
+            ("", " [/src/top.v:7]"),
+            ("", " [/src/top.v:7]  "),
+            ("/src/top.v:7 ", ""),
+            ("x /src/top.v:7] ", " /src/sub.sv:12"),
+        ],
+    )
+    def test_vivado_file_reference_search_matches_patterns(
+        self, unit: str, prefix: str, suffix: str
+    ) -> None:
+        """The linear-time searches should match exactly what the patterns match."""
+        from sawmill.plugins.vivado import (
+            _FILE_REF_INLINE_PATTERN,
+            _FILE_REF_PATTERN,
+            _search_file_ref,
+            _search_inline_file_ref,
+        )
+
+        def result(match):
+            return None if match is None else (match.span(), match.groups())
+
+        # Short enough for the plain patterns to finish quickly
+        content = prefix + unit * 300 + suffix
+
+        assert result(_search_file_ref(content)) == result(_FILE_REF_PATTERN.search(content))
+        assert result(_search_inline_file_ref(content)) == result(
+            _FILE_REF_INLINE_PATTERN.search(content)
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[" * 50000,
+            "[a:1" * 20000,
+            "/a" * 50000,
+            "/a.b:x" * 20000,
+        ],
+    )
+    def test_vivado_file_reference_long_line_is_linear(self, content: str) -> None:
+        """Long lines without a reference should not backtrack quadratically.
+
+        With quadratic backtracking these inputs take tens of seconds; in
+        linear time they take milliseconds. The time limit is only a guard
+        against hanging and is far above what a slow runner needs.
+        """
+        import time
+
+        plugin = VivadoPlugin()
+
+        start = time.perf_counter()
+        ref = plugin.extract_file_reference(content)
+        elapsed = time.perf_counter() - start
+
+        assert ref is None
+        assert elapsed < 5.0
+
 
 class TestVivadoGetFilters:
     """Tests for VivadoPlugin.get_filters()."""
@@ -255,6 +255,21 @@ class TestReportFileCreation:
 
         assert report_file.exists()
 
+    def test_report_bare_file_name(self, tmp_path, monkeypatch):
+        """A bare report file name should be written to the current directory."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("# Vivado v2025.2\nINFO: [Common 17-1] test\n")
+        monkeypatch.chdir(tmp_path)
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["--check", "--plugin", "vivado", "--report", "report.json", str(log_file)],
+        )
+
+        assert result.exit_code == 0
+        assert (tmp_path / "report.json").exists()
+
     def test_report_is_valid_json(self, tmp_path):
         """Report file should be valid JSON."""
         log_file = tmp_path / "test.log"
@@ -567,3 +582,45 @@ class TestReportUnusedWaivers:
         assert "unused_waivers" in report
         assert len(report["unused_waivers"]) == 1
         assert report["unused_waivers"][0]["pattern"] == "Route 99-99"
+
+    def test_report_duplicate_waivers_count_as_used(self, tmp_path):
+        """Exact duplicate waivers should be used together, not reported unused."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text(
+            "# Vivado v2025.2\n"
+            "ERROR: [Synth 8-1] error\n"
+        )
+
+        waiver = (
+            '[[waiver]]\npattern = "Synth 8-1"\n'
+            'type = "id"\n'
+            'reason = "Used waiver"\n'
+            'author = "test"\n'
+            'date = "2025-01-01"\n\n'
+        )
+        waiver_file = tmp_path / "waivers.toml"
+        waiver_file.write_text(waiver * 2)
+
+        report_file = tmp_path / "report.json"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "--check",
+                "--plugin",
+                "vivado",
+                "--waivers",
+                str(waiver_file),
+                "--report-unused",
+                "--report",
+                str(report_file),
+                str(log_file),
+            ],
+        )
+
+        report = json.loads(report_file.read_text())
+
+        assert result.exit_code == 0
+        assert report["unused_waivers"] == []
+        assert "Unused Waivers" not in result.output
@@ -342,6 +342,70 @@ class TestPluginEntryPointDiscovery:
         manager = _get_plugin_manager()
         assert "vivado" in manager.list_plugins()
 
+    def test_get_plugin_manager_is_cached(self):
+        """_get_plugin_manager() should discover plugins once per process."""
+        from sawmill.__main__ import _get_plugin_manager
+
+        assert _get_plugin_manager() is _get_plugin_manager()
+
+    def test_reset_plugin_manager_rediscovers(self):
+        """_reset_plugin_manager() should make the next call build a new manager."""
+        from sawmill.__main__ import _get_plugin_manager, _reset_plugin_manager
+        from sawmill.core.plugin import _plugin_entry_points
+
+        first = _get_plugin_manager()
+        _reset_plugin_manager()
+        assert _plugin_entry_points.cache_info().currsize == 0
+
+        second = _get_plugin_manager()
+
+        assert second is not first
+        assert second.list_plugins() == first.list_plugins()
+        # The entry points were looked up again, not served from the cache
+        info = _plugin_entry_points.cache_info()
+        assert info.currsize == 1
+        assert info.hits == 0
+
+    def test_plugin_without_iter_messages(self, tmp_path, monkeypatch):
+        """A plugin without the streaming hook should be parsed with load_and_parse."""
+        import sawmill.__main__ as main_module
+        from sawmill.core.plugin import PluginManager
+        from sawmill.plugin import hookimpl
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        class PlainPlugin:
+            """A pluggy plugin that does not subclass SawmillPlugin."""
+
+            name = "plain"
+
+            def __init__(self):
+                self._vivado = VivadoPlugin()
+
+            @hookimpl
+            def load_and_parse(self, path):
+                return self._vivado.load_and_parse(path)
+
+            @hookimpl
+            def get_severity_levels(self):
+                return self._vivado.get_severity_levels()
+
+        manager = PluginManager()
+        manager.register(PlainPlugin())
+        monkeypatch.setattr(main_module, "_get_plugin_manager", lambda: manager)
+
+        log_file = tmp_path / "test.log"
+        log_file.write_text(
+            "# Vivado v2025.2\nINFO: [Test 1-1] info\nERROR: [Test 2-2] failure\n"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, [str(log_file), "--plugin", "plain", "--severity", "error"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == ["ERROR: [Test 2-2] failure"]
+
     def test_no_direct_vivado_import(self):
         """__main__.py should not directly import VivadoPlugin."""
         import inspect
@@ -350,6 +414,74 @@ class TestPluginEntryPointDiscovery:
         source = inspect.getsource(main_module)
         assert "from sawmill.plugins.vivado import" not in source
 
+    def test_cli_import_defers_heavy_modules(self):
+        """Importing the CLI should not load Rich rendering or the core engines."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, sawmill.__main__; "
+            "print([m for m in ('rich.console', 'sawmill.core') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestSeverityTables:
+    """Tests for _get_severity_tables()."""
+
+    def test_levels_read_once_per_plugin(self):
+        """The severity hook should run once per plugin instance."""
+        from sawmill.__main__ import (
+            _get_severity_level_map,
+            _get_severity_levels,
+            _get_severity_style_map,
+        )
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        class CountingPlugin(VivadoPlugin):
+            calls = 0
+
+            def get_severity_levels(self):
+                type(self).calls += 1
+                return super().get_severity_levels()
+
+        plugin = CountingPlugin()
+        levels = _get_severity_levels(plugin)
+        level_map = _get_severity_level_map(plugin)
+        style_map = _get_severity_style_map(plugin)
+
+        assert CountingPlugin.calls == 1
+        assert [level.id for level in levels] == list(level_map)
+        assert level_map["error"] == 3
+        assert style_map["error"] == "red bold"
+
+        _get_severity_levels(CountingPlugin())
+        assert CountingPlugin.calls == 2
+
+    def test_missing_plugin_raises(self):
+        """A missing plugin should still raise instead of being cached."""
+        from sawmill.__main__ import _get_severity_levels
+
+        with pytest.raises(RuntimeError, match="get_severity_levels"):
+            _get_severity_levels(None)
+
+    def test_ranked_levels_most_severe_first(self):
+        """Ranked levels should be sorted by level, most severe first."""
+        from sawmill.__main__ import _get_severity_tables
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        class ReorderedPlugin(VivadoPlugin):
+            def get_severity_levels(self):
+                return list(reversed(super().get_severity_levels()))
+
+        tables = _get_severity_tables(ReorderedPlugin())
+
+        assert [level.level for level in tables.ranked] == [3, 2, 1, 0]
+        assert [level.level for level in tables.levels] == [0, 1, 2, 3]
+
 
 class TestGetFailOnLevel:
     """Tests for _get_fail_on_level() with various severity schemes."""
@@ -415,3 +547,164 @@ class TestGetFailOnLevel:
         plugin = VivadoPlugin()
         with pytest.raises(click.BadParameter, match="Unknown severity"):
             _get_fail_on_level("nonexistent", plugin)
+
+
+class TestApplyWaivers:
+    """Tests for _apply_waivers()."""
+
+    def test_used_waivers_listed_once_in_first_use_order(self):
+        """Each matching waiver should be reported once, in first-use order."""
+        from sawmill.__main__ import _apply_waivers
+        from sawmill.core.waiver import WaiverMatcher
+        from sawmill.models.message import Message
+        from sawmill.models.waiver import Waiver
+
+        common = dict(reason="known", author="ci", date="2026-01-01")
+        first = Waiver(type="id", pattern="Synth 8-1", **common)
+        second = Waiver(type="id", pattern="Synth 8-2", **common)
+        unused = Waiver(type="id", pattern="Synth 8-3", **common)
+        messages = [
+            Message(start_line=i, end_line=i, raw_text=f"m{i}", content=f"m{i}", message_id=mid)
+            for i, mid in enumerate(["Synth 8-2", "Synth 8-1", "Synth 8-2", "Route 35-9"], 1)
+        ]
+
+        unwaived, waived, used = _apply_waivers(
+            messages, WaiverMatcher([first, second, unused])
+        )
+
+        assert [m.message_id for m in unwaived] == ["Route 35-9"]
+        assert len(waived) == 3
+        assert used == [second, first]
+        assert used[0] is second
+
+    def test_duplicate_waivers_listed_once(self):
+        """Equal waivers should count as one used waiver."""
+        from sawmill.__main__ import _apply_waivers
+        from sawmill.core.waiver import WaiverMatcher
+        from sawmill.models.message import Message
+        from sawmill.models.waiver import Waiver
+
+        common = dict(type="id", pattern="Synth 8-1", reason="known", author="ci", date="2026-01-01")
+        first = Waiver(**common)
+        duplicate = Waiver(**common)
+        messages = [
+            Message(start_line=1, end_line=1, raw_text="m1", content="m1", message_id="Synth 8-1")
+        ]
+
+        _, waived, used = _apply_waivers(messages, WaiverMatcher([first, duplicate]))
+
+        assert len(waived) == 1
+        assert used == [first]
+
+
+class TestHasCheckFailures:
+    """Tests for _has_check_failures()."""
+
+    @staticmethod
+    def _message(severity):
+        from sawmill.models.message import Message
+
+        return Message(start_line=1, end_line=1, raw_text="m", content="m", severity=severity)
+
+    def test_fails_at_or_above_threshold(self):
+        """Messages at or above the threshold should fail the check."""
+        from sawmill.__main__ import _has_check_failures
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        plugin = VivadoPlugin()
+        messages = [self._message("info"), self._message("warning")]
+
+        assert _has_check_failures(messages, plugin, min_level=1)
+        assert not _has_check_failures(messages, plugin, min_level=2)
+
+    def test_severity_case_and_unknown_ids(self):
+        """Severity IDs are matched case-insensitively; unknown IDs count as level 0."""
+        from sawmill.__main__ import _has_check_failures
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        plugin = VivadoPlugin()
+
+        assert _has_check_failures([self._message("ERROR")], plugin, min_level=3)
+        assert not _has_check_failures([self._message("custom")], plugin, min_level=1)
+        assert _has_check_failures([self._message("custom")], plugin, min_level=0)
+        assert not _has_check_failures([self._message(None)], plugin, min_level=0)
+
+    def test_messages_without_severity_never_fail(self):
+        """Severity-less messages should pass even at the lowest threshold."""
+        from sawmill.__main__ import _has_check_failures
+        from sawmill.core.waiver import WaiverMatcher
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        plugin = VivadoPlugin()
+        messages = [self._message(None), self._message("")]
+
+        assert not _has_check_failures(messages, plugin, min_level=0)
+        assert not _has_check_failures(messages, plugin, min_level=0, matcher=WaiverMatcher([]))
+
+    def test_check_fail_on_lowest_level_ignores_severity_less_messages(
+        self, tmp_path, monkeypatch
+    ):
+        """--check --fail-on at the lowest level should pass messages without a severity."""
+        import sawmill.__main__ as main_module
+        from sawmill.core.plugin import PluginManager
+        from sawmill.plugin import hookimpl
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        class NoSeverityPlugin(VivadoPlugin):
+            name = "nosev"
+
+            @hookimpl
+            def load_and_parse(self, path):
+                return [
+                    TestHasCheckFailures._message(None),
+                    TestHasCheckFailures._message(""),
+                ]
+
+            @hookimpl
+            def iter_messages(self, path):
+                return iter(self.load_and_parse(path))
+
+        manager = PluginManager()
+        manager.register(NoSeverityPlugin())
+        monkeypatch.setattr(main_module, "_get_plugin_manager", lambda: manager)
+
+        log_file = tmp_path / "test.log"
+        log_file.write_text("plain line\n")
+        waiver_file = tmp_path / "waivers.toml"
+        waiver_file.write_text(
+            '[[waiver]]\ntype = "id"\npattern = "Other 1-1"\n'
+            'reason = "unrelated"\nauthor = "ci"\ndate = "2026-01-01"\n'
+        )
+
+        runner = CliRunner()
+        args = [str(log_file), "--plugin", "nosev", "--check", "--fail-on", "info"]
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0, result.output
+
+        result = runner.invoke(cli, args + ["--waivers", str(waiver_file)])
+        assert result.exit_code == 0, result.output
+
+    def test_waived_failures_do_not_fail(self):
+        """With a matcher, only failing messages that no waiver matches count."""
+        from sawmill.__main__ import _has_check_failures
+        from sawmill.core.waiver import WaiverMatcher
+        from sawmill.models.message import Message
+        from sawmill.models.waiver import Waiver
+        from sawmill.plugins.vivado import VivadoPlugin
+
+        plugin = VivadoPlugin()
+        waiver = Waiver(
+            type="id", pattern="Synth 8-1", reason="known", author="ci", date="2026-01-01"
+        )
+        matcher = WaiverMatcher([waiver])
+        waived = Message(
+            start_line=1, end_line=1, raw_text="e", content="e",
+            severity="error", message_id="Synth 8-1",
+        )
+        unwaived = Message(
+            start_line=2, end_line=2, raw_text="e", content="e",
+            severity="error", message_id="Synth 8-2",
+        )
+
+        assert not _has_check_failures([waived], plugin, min_level=3, matcher=matcher)
+        assert _has_check_failures([waived, unwaived], plugin, min_level=3, matcher=matcher)
@@ -95,6 +95,22 @@ class TestJsonFormat:
         assert len(lines) > 0
 
 
+    def test_json_format_many_messages_in_order(self, tmp_path):
+        """JSON format writes every message once, in order, across output batches."""
+        log_file = tmp_path / "vivado.log"
+        log_file.write_text(
+            "# Vivado v2025.2\n"
+            + "".join(f"INFO: [Synth 8-{i}] message {i}\n" for i in range(2500))
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(cli, [str(log_file), "--plugin", "vivado", "--format", "json"])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["start_line"] for r in records] == list(range(2, 2502))
+
+
 class TestCountFormat:
     """Tests for count (summary) output format."""
 
@@ -207,6 +223,23 @@ class TestCountFormat:
         assert result.exit_code == 0
         assert "total=" in result.output
 
+    def test_count_format_with_check(self, tmp_path):
+        """Count format still feeds the filtered messages to --check."""
+        log_file = tmp_path / "vivado.log"
+        log_file.write_text(
+            "# Vivado v2025.2\n"
+            "ERROR: [E1 1-1] e1\n"
+            "INFO: [I1 3-1] i1\n"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, [str(log_file), "--plugin", "vivado", "--format", "count", "--check"]
+        )
+
+        assert result.exit_code == 1
+        assert "total=2" in result.output
+
 
 class TestTextFormat:
     """Tests for text (default) output format."""
@@ -223,6 +256,58 @@ class TestTextFormat:
         # Should have raw text output, not JSON
         assert "ERROR: [Test 1-1] message" in result.output
 
+    def test_text_format_piped_output_is_raw(self, tmp_path):
+        """Piped text output keeps long lines and emoji codes as in the log."""
+        line = "WARNING: [Test 1-1] " + "word " * 40 + ":warning: end"
+        log_file = tmp_path / "vivado.log"
+        log_file.write_text(f"# Vivado v2025.2\n{line}\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, [str(log_file), "--plugin", "vivado"])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [line]
+
+    def test_text_format_terminal_output_is_styled(self):
+        """Terminal text output styles each message by severity, in order."""
+        import re
+        from io import StringIO
+
+        from rich.console import Console
+
+        from sawmill.__main__ import _TEXT_OUTPUT_BATCH_SIZE, _output_messages
+        from sawmill.models.message import Message
+
+        severities = ["error", "warning", None]
+        count = _TEXT_OUTPUT_BATCH_SIZE + 10
+        messages = [
+            Message(
+                start_line=i,
+                end_line=i,
+                raw_text=f"line {i} [not/markup]",
+                content=f"line {i}",
+                severity=severities[i % 3],
+            )
+            for i in range(count)
+        ]
+        style_map = {"error": "red bold", "warning": "yellow"}
+
+        out = StringIO()
+        console = Console(file=out, force_terminal=True, color_system="standard", width=200)
+        _output_messages(console, messages, "text", style_map, ["error", "warning"])
+        lines = out.getvalue().splitlines()
+
+        assert len(lines) == count
+        assert [re.sub(r"\x1b\[[0-9;]*m", "", line) for line in lines] == [
+            msg.raw_text for msg in messages
+        ]
+        codes = {"error": "\x1b[1;31m", "warning": "\x1b[33m"}
+        for msg, line in zip(messages, lines):
+            if msg.severity is None:
+                assert "\x1b[" not in line
+            else:
+                assert line.startswith(codes[msg.severity])
+
     def test_text_format_explicit(self, tmp_path):
         """Text format can be explicitly specified."""
         log_file = tmp_path / "vivado.log"
@@ -263,6 +348,18 @@ class TestTextFormat:
         assert "WARNING: [W1 2-1] second" in result.output
         assert "ERROR: [E1 3-1] third" in result.output
 
+    def test_text_format_many_messages_in_order(self, tmp_path):
+        """Text format prints every message once, in order, across output batches."""
+        lines = [f"INFO: [Synth 8-{i}] message {i}" for i in range(600)]
+        log_file = tmp_path / "vivado.log"
+        log_file.write_text("# Vivado v2025.2\n" + "\n".join(lines) + "\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, [str(log_file), "--plugin", "vivado", "--format", "text"])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == lines
+
 
 class TestFormatWithFilters:
     """Tests that formats work correctly with filters."""
@@ -161,6 +161,26 @@ class TestMultipleIdPatterns:
         assert "Route" in result.output
         assert "DRC" not in result.output
 
+    def test_compiled_patterns_match_whole_id(self):
+        """Combined glob patterns should match like fnmatch, anchored at both ends."""
+        from sawmill.__main__ import _compile_id_patterns
+
+        pattern = _compile_id_patterns(["Synth 8-*", "DRC ?-1"])
+
+        assert pattern.match("Synth 8-6157")
+        assert pattern.match("DRC 2-1")
+        assert not pattern.match("DRC 2-10")
+        assert not pattern.match("Route 35-9")
+
+    def test_compiled_patterns_are_case_sensitive(self):
+        """Message ID globs should match case-sensitively on every platform."""
+        from sawmill.__main__ import _compile_id_patterns
+
+        pattern = _compile_id_patterns(["Synth 8-*"])
+
+        assert pattern.match("Synth 8-6157")
+        assert not pattern.match("synth 8-6157")
+
 
 class TestCategoryFilter:
     """Tests for category filtering."""
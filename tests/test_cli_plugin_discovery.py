@@ -34,6 +34,36 @@ class TestListPlugins:
         # Vivado plugin description contains "Vivado"
         assert "vivado" in result.output.lower()
 
+    def test_list_plugins_ignores_other_arguments(self):
+        """--list-plugins is eager and runs before the logfile is validated."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["missing.log", "--list-plugins"])
+
+        assert result.exit_code == 0
+        assert "vivado" in result.output.lower()
+
+
+class TestVersion:
+    """Tests for --version option."""
+
+    def test_version(self):
+        """--version should print the package version."""
+        from sawmill import __version__
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output == f"sawmill {__version__}\n"
+
+    def test_version_ignores_other_arguments(self):
+        """--version is eager and runs before the logfile is validated."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["missing.log", "--version"])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("sawmill ")
+
 
 class TestShowPluginInfo:
     """Tests for --show-info option."""